@@ -2,10 +2,10 @@
 Contains classes and a script used to run and manage the Abagio game.
 
 Classes:
-    State - an Enum representing the overall game state.
-    TurnStage - an Enum representing the stage of a player's turn.
-    RollState - an Enum representing the roll state of a turn.
-    MoveState - an Enum representing the movement state of a turn.
+    State - an IntEnum representing the overall game state.
+    TurnStage - an IntEnum representing the stage of a player's turn.
+    RollState - an IntEnum representing the roll state of a turn.
+    MoveState - an IntEnum representing the movement state of a turn.
     Game - manages an Abagio game.
 
 The script, which runs if this module is executed directly, starts /
@@ -16,60 +16,153 @@ runs the Abagio game.
 import os
 os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "hide"
 
-from enum import Enum
+from enum import IntEnum
 
 import pygame
 
-from abagio.interface import Window, ResourceManager
-from abagio.timer import Timer
-from abagio.gamepieces import Die, Board, Frog
+from abagio.interface import Window, ResourceManager, WHITE, BLACK
+from abagio.gamepieces import Die, Board, Frog, FrogContext
 
-State = Enum("State", ("SETUP", "SETUP_TIE", "SETUP_WAITING", "MAIN_GAME"))
-"""
-Represents the overall state of an Abagio game. Subclass of Enum.
 
-Additional methods: none
+class State(IntEnum):
+    """
+    Represents the overall state of an Abagio game. Subclass of IntEnum.
 
-Additional enum class constants: SETUP, SETUP_TIE, SETUP_WAITING,
-    MAIN_GAME
-"""
+    Additional methods: none
 
-TurnStage = Enum("Turn Stage", ("ROLL", "MOVE"))
-"""
-Represents the stage of a player's turn in an Abagio game.
+    Additional enum class constants: SETUP, SETUP_TIE, SETUP_WAITING,
+        MAIN_GAME
+    """
 
-Should be used within the MAIN_GAME State. Subclass of Enum.
+    SETUP = 1
+    SETUP_TIE = 2
+    SETUP_WAITING = 3
+    MAIN_GAME = 4
 
-Additional methods: none
 
-Additional enum class constants: ROLL, MOVE
-"""
+class TurnStage(IntEnum):
+    """
+    Represents the stage of a player's turn in an Abagio game.
 
-RollState = Enum("Roll State", ("BEFORE_ROLL", "DURING_ROLL", "AFTER_ROLL"))
-"""
-Represents the state of a roll in an Abagio game.
+    Should be used within the MAIN_GAME State. Subclass of IntEnum.
 
-Should be used within the SETUP state, or within the ROLL TurnStage
-within the MAIN_GAME State. Subclass of Enum.
+    Additional methods: none
 
-Additional methods: none
+    Additional enum class constants: ROLL, MOVE
+    """
 
-Additional enum class constants: BEFORE_ROLL, DURING_ROLL, AFTER_ROLL
-"""
+    ROLL = 1
+    MOVE = 2
 
-MoveState = Enum("Move State", ("BEFORE_DIE", "BEFORE_FROG",
-                                "BEFORE_FROG_ERROR", "DURING_FROG_MOVEMENT"))
-"""
-Represents the state of movement in a turn in an Abagio game.
 
-Should be used within the MOVE TurnStage within the MAIN_GAME State.
-Subclass of Enum.
+class RollState(IntEnum):
+    """
+    Represents the state of a roll in an Abagio game.
 
-Additional methods: none
+    Should be used within the SETUP state, or within the ROLL TurnStage
+    within the MAIN_GAME State. Subclass of IntEnum.
 
-Additional enum class constants: BEFORE_DIE, BEFORE_FROG,
-    BEFORE_FROG_ERROR, DURING_FROG_MOVEMENT
-"""
+    Additional methods: none
+
+    Additional enum class constants: BEFORE_ROLL, DURING_ROLL, AFTER_ROLL
+    """
+
+    BEFORE_ROLL = 1
+    DURING_ROLL = 2
+    AFTER_ROLL = 3
+
+
+class MoveState(IntEnum):
+    """
+    Represents the state of movement in a turn in an Abagio game.
+
+    Should be used within the MOVE TurnStage within the MAIN_GAME State.
+    Subclass of IntEnum.
+
+    Additional methods: none
+
+    Additional enum class constants: BEFORE_DIE, BEFORE_FROG,
+        BEFORE_FROG_ERROR, DURING_FROG_MOVEMENT
+    """
+
+    BEFORE_DIE = 1
+    BEFORE_FROG = 2
+    BEFORE_FROG_ERROR = 3
+    DURING_FROG_MOVEMENT = 4
+
+
+# The names of the spaces on the paths the frogs travel around the
+# board. Both paths share the outer ring of spaces but start at
+# different roots (the first player's frogs start at "sw" and the second
+# player's frogs start at "se"), and each color has its own inner path
+# leading to its own end space.
+_SW_PATH_START = ("sw", "1", "2", "3", "4", "5", "6", "7", "8", "9", "10",
+                  "11", "12", "13", "14", "15", "16", "17", "18", "19")
+_SE_PATH_START = ("se",) + _SW_PATH_START[1:]
+_RED_PATH_END = ("20r", "21r", "22r", "23r", "24r", "25r", "26", "er")
+_PURPLE_PATH_END = ("20p", "21p", "22p", "23p", "24p", "25p", "26", "ep")
+
+# A dictionary from the color of the player going first to a tuple of
+# the path space names for the first player's frogs and the path space
+# names for the second player's frogs.
+_PATH_SPACE_NAMES = {
+    "red": (_SW_PATH_START + _RED_PATH_END,
+            _SE_PATH_START + _PURPLE_PATH_END),
+    "purple": (_SW_PATH_START + _PURPLE_PATH_END,
+               _SE_PATH_START + _RED_PATH_END),
+}
+
+# The starting positions of the frogs, in the order they are added to
+# the board, as tuples of the player the frog belongs to (0 for the
+# player going first and 1 for the player going second) and the name of
+# the space the frog starts on.
+_FROG_LAYOUT = (((0, "sw"),) * 6 + ((1, "se"),) * 6
+                + ((0, "5"), (1, "5"), (0, "5"), (1, "5"),
+                   (1, "10"), (0, "10"), (1, "10"), (0, "10"),
+                   (0, "15"), (1, "15"), (0, "15"), (1, "15")))
+
+
+# Messages for the players that depend on whose turn it is, built once
+# for each player so that they do not need to be rebuilt every frame.
+# _ROLL_MESSAGES, _FIRST_ROLL_MESSAGES, and _NEXT_DIE_MESSAGES are keyed
+# by the current player's color; _FIRST_DIE_MESSAGES is keyed by the
+# current player's color and whether they rolled doubles; and
+# _FROG_MESSAGES and _FROG_ERROR_MESSAGES are keyed by the current
+# player's color and whether they can still change their die selection.
+_ROLL_MESSAGES = {
+    player: player.capitalize() + " player, please\nroll."
+    for player in ("red", "purple")
+}
+_FIRST_ROLL_MESSAGES = {
+    player: (player.capitalize() + " player will\ngo first.\n\n"
+             + _ROLL_MESSAGES[player])
+    for player in ("red", "purple")
+}
+_FIRST_DIE_MESSAGES = {
+    (player, doubles): (
+        ("You rolled doubles!\nYou may use each\ndie twice.\n\n"
+         if doubles else "")
+        + player.capitalize() + " player, please\nclick on the die that\n"
+        + "you would like to use\nfirst.")
+    for player in ("red", "purple") for doubles in (True, False)
+}
+_NEXT_DIE_MESSAGES = {
+    player: (player.capitalize() + " player, please\nclick on the die that\n"
+             + "you would like to use\nnext.")
+    for player in ("red", "purple")
+}
+_FROG_MESSAGES = {
+    (player, can_change_die): (
+        player.capitalize() + " player, please\nclick on the frog\n"
+        + "that you would like\nto move."
+        + ("\n\n(You may also\nchange your die\nselection if you\n"
+           + "would like to.)" if can_change_die else ""))
+    for player in ("red", "purple") for can_change_die in (True, False)
+}
+_FROG_ERROR_MESSAGES = {
+    key: "Invalid target. Please\ntry again.\n\n" + message
+    for key, message in _FROG_MESSAGES.items()
+}
 
 
 class Game:
@@ -88,6 +181,8 @@ class Game:
             onto the window.
         BOARD_Y - the y coordinate where the game board image is drawn
             onto the window.
+        FRAME_RATE - the maximum number of frames (calls to the tick
+            method) per second.
     """
     
     # Non-public instance variables:
@@ -115,11 +210,6 @@ class Game:
     #        to None.
     #    _rolls - a dictionary used to store the rolls of "red" and
     #        "purple" during the roll for position.
-    #    _setup_timer - a Timer used to time the pause between the end
-    #        of the final roll for position and the start of the main
-    #        game (to time the length of the SETUP_WAITING state).
-    #    _indicator_timer - a Timer used for the timing of blinking die
-    #        indicators.
     #    _clock - a Pygame Clock used to calculate time deltas between
     #        the rendering of frogs from one tick to the next.
     #    _state - a State representing the current overall part of the
@@ -141,9 +231,53 @@ class Game:
     #    _indicator_on - whether or not the currently blinking die
     #        indicator is in the on state, if applicable.
     #    _doubles - whether or not the player rolled doubles.
+    #    _background - a Surface the size of the window holding the
+    #        static parts of every frame (the white background, the
+    #        game board, and the yellow text box).
+    #    _text_cache - a dictionary from each message that has been
+    #        displayed in the yellow text box to the Surface it was
+    #        rendered onto, so that each message is only rendered once.
+    #    _button_images - a dictionary from "roll", "stop", and "ok" to
+    #        the pre-rendered Surface of the corresponding button.
+    #    _die_images - a tuple of the images of the faces of a die,
+    #        from 1 to 6 (so the image for a die showing n is at index
+    #        n - 1).
+    #    _indicator_images - a dictionary from each color a die
+    #        indicator can be displayed in to the pre-rendered Surface
+    #        of an indicator of that color.
+    #    _state_ticks - a dictionary from each State to the method that
+    #        renders items and updates the game in that state.
+    #    _move_state_ticks - a dictionary from each MoveState to the
+    #        method that renders items and updates the game in that
+    #        move state.
+
+    # Non-public class constants:
+    #    _SETUP_WAITING_EVENT - the type of the Pygame event posted by a
+    #        Pygame timer at the end of the pause between the final roll
+    #        for position and the start of the main game (at the end of
+    #        the SETUP_WAITING state).
+    #    _BLINK_EVENT - the type of the Pygame event repeatedly posted
+    #        by a Pygame timer while a die is selected to toggle its
+    #        blinking die indicator.
+    #    _EVENT_TYPES - the types of Pygame events the game handles. All
+    #        other event types are blocked from the event queue.
+
+    __slots__ = ("_window", "_resource_manager", "_background", "_board",
+                 "_frogs", "_die1", "_die2", "_selected_die",
+                 "_die1_collision_rect", "_die2_collision_rect", "_ok_button",
+                 "_roll_button", "_rolls", "_clock", "_state", "_turn_stage",
+                 "_roll_state", "_move_state", "_rolling_player",
+                 "_has_rolled_before", "_indicator_on", "_doubles",
+                 "_text_cache", "_button_images", "_die_images",
+                 "_indicator_images", "_state_ticks", "_move_state_ticks")
 
     BOARD_X = 320
     BOARD_Y = 60
+    FRAME_RATE = 60
+    _SETUP_WAITING_EVENT = pygame.USEREVENT + 1
+    _BLINK_EVENT = pygame.USEREVENT + 2
+    _EVENT_TYPES = (pygame.QUIT, pygame.MOUSEBUTTONUP, pygame.WINDOWEXPOSED,
+                    pygame.WINDOWRESTORED, _SETUP_WAITING_EVENT, _BLINK_EVENT)
     
     def __init__(self):
         """
@@ -154,6 +288,12 @@ class Game:
         """
         self._window = Window()
         self._resource_manager = ResourceManager()
+        self._background = self._create_background()
+        
+        # Keep events the game does not handle out of the event queue.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(Game._EVENT_TYPES)
+        
         self._board = Board()
         self._frogs = []
         
@@ -166,8 +306,6 @@ class Game:
         self._roll_button = None
         
         self._rolls = {}
-        self._setup_timer = Timer()  # does not start yet
-        self._indicator_timer = Timer()  # does not start yet
         self._clock = pygame.time.Clock()
         
         self._state = State.SETUP
@@ -179,28 +317,84 @@ class Game:
         self._has_rolled_before = False
         self._indicator_on = True
         self._doubles = False
+        self._text_cache = {}
+        self._button_images = {
+            "roll": self._window.render_button(100, 50, "Roll", "green",
+                                               BLACK),
+            "stop": self._window.render_button(100, 50, "Stop", "red",
+                                               BLACK),
+            "ok": self._window.render_button(100, 50, "OK", "green", BLACK),
+        }
+        self._die_images = tuple(self._resource_manager.images[f"die {i}"]
+                                 for i in range(1, 7))
+        self._indicator_images = {
+            color: self._window.render_circle(8, color)
+            for color in ("red", "green", "white")
+        }
+        
+        self._state_ticks = {
+            State.SETUP: self._tick_setup,
+            State.SETUP_TIE: self._tick_setup_tie,
+            State.SETUP_WAITING: self._tick_setup_waiting,
+            State.MAIN_GAME: self._tick_main_game,
+        }
+        self._move_state_ticks = {
+            MoveState.BEFORE_DIE: self._tick_move_before_die,
+            MoveState.BEFORE_FROG: self._tick_move_before_frog,
+            MoveState.BEFORE_FROG_ERROR: self._tick_move_before_frog_error,
+            MoveState.DURING_FROG_MOVEMENT:
+                self._tick_move_during_frog_movement,
+        }
+
+    def _create_background(self):
+        # Return a Surface the size of the window with the static parts
+        # of every frame (the white background, the game board, and the
+        # yellow text box onto which messages for the players will be
+        # overlaid) drawn onto it.
+        background = pygame.Surface(
+            self._window.game_display.get_size()).convert()
+        background.fill(WHITE)
+        background.blit(self._resource_manager.images["board"],
+                        (Game.BOARD_X, Game.BOARD_Y))
+        pygame.draw.rect(background, pygame.Color("yellow"),
+                         (Game.BOARD_X - 290, Game.BOARD_Y, 260, 500))
+        return background
 
     def _handle_events(self):
         # Handle the events in the Pygame event queue by performing the
-        # appropriate action for each "mouse button up" event. If a
-        # "quit" event is found, immediately return True and stop
+        # appropriate action for each "mouse button up", timer, and
+        # window expose/restore event.
+        # If a "quit" event is found, immediately return True and stop
         # processing events. If no "quit" event is found, return False.
-        for event in pygame.event.get():
+        for event in pygame.event.get(Game._EVENT_TYPES):
             if event.type == pygame.QUIT:
                 return True
             if event.type == pygame.MOUSEBUTTONUP:
-                self._handle_mouse_up()
+                self._handle_mouse_up(pygame.mouse.get_pos())
+            elif event.type in (pygame.WINDOWEXPOSED,
+                                pygame.WINDOWRESTORED):
+                # The window's contents may have been lost, so redraw
+                # all of it rather than just what changed this frame.
+                self._window.invalidate_display()
+            elif event.type == Game._BLINK_EVENT:
+                self._indicator_on = not self._indicator_on
+            elif (event.type == Game._SETUP_WAITING_EVENT
+                    and self._state is State.SETUP_WAITING):
+                self._end_setup()
         return False
     
-    def _handle_mouse_up(self):
+    def _handle_mouse_up(self, mouse_pos):
         # Handle a "mouse button up" event by checking for mouse
         # collision with buttons, dice, and/or frogs and performing the
         # appropriate action.
+        #
+        # Arguments:
+        #    mouse_pos - the position of the mouse when the event was
+        #        handled, as an (x, y) tuple.
         if self._state is State.SETUP:
             # If the roll button exists and the mouse is on it...
             if (self._roll_button is not None
-                    and self._roll_button.collidepoint(
-                        pygame.mouse.get_pos())):
+                    and self._roll_button.collidepoint(mouse_pos)):
                 if self._roll_state is RollState.BEFORE_ROLL:
                     self._die1.start_roll()
                     self._roll_state = RollState.DURING_ROLL
@@ -210,15 +404,14 @@ class Game:
                     
         elif self._state is State.SETUP_TIE:
             if (self._ok_button is not None
-                    and self._ok_button.collidepoint(pygame.mouse.get_pos())):
+                    and self._ok_button.collidepoint(mouse_pos)):
                 self._rolling_player = "red"
                 self._roll_state = RollState.BEFORE_ROLL
                 self._state = State.SETUP
         
         elif self._state is State.MAIN_GAME:
             if (self._roll_button is not None
-                    and self._roll_button.collidepoint(
-                        pygame.mouse.get_pos())):
+                    and self._roll_button.collidepoint(mouse_pos)):
                 if self._roll_state is RollState.BEFORE_ROLL:
                     self._die1.start_roll()
                     self._die2.start_roll()
@@ -229,51 +422,67 @@ class Game:
                     self._roll_state = RollState.AFTER_ROLL
             
             if self._turn_stage is TurnStage.MOVE:
-                self._handle_mouse_up_move_stage()
+                self._handle_mouse_up_move_stage(mouse_pos)
 
-    def _handle_mouse_up_move_stage(self):
+    def _handle_mouse_up_move_stage(self, mouse_pos):
         # Handle a "mouse button up" event in the MOVE turn stage by
         # checking for mouse collision with dice and/or frogs and
         # performing the appropriate action.
+        #
+        # Arguments:
+        #    mouse_pos - the position of the mouse when the event was
+        #        handled, as an (x, y) tuple.
         if (self._move_state is MoveState.BEFORE_DIE
                 or self._move_state is MoveState.BEFORE_FROG
                 or self._move_state is MoveState.BEFORE_FROG_ERROR):
             # If the mouse is on the die and the die hasn't been used
             # up yet...
-            if (self._die1_collision_rect.collidepoint(pygame.mouse.get_pos())
+            if (self._die1_collision_rect.collidepoint(mouse_pos)
                     and (self._die1.use_count == 0
                          or (self._doubles and self._die1.use_count == 1))):
-                self._move_state = MoveState.BEFORE_FROG
-                self._selected_die = self._die1
-                self._indicator_on = True
-                self._indicator_timer.start(500)
-            elif (self._die2_collision_rect.collidepoint(
-                    pygame.mouse.get_pos()) and (self._die2.use_count == 0
-                        or (self._doubles and self._die2.use_count == 1))):
-                self._move_state = MoveState.BEFORE_FROG
-                self._selected_die = self._die2
-                self._indicator_on = True
-                self._indicator_timer.start(500)
+                self._select_die(self._die1)
+            elif (self._die2_collision_rect.collidepoint(mouse_pos)
+                    and (self._die2.use_count == 0
+                         or (self._doubles and self._die2.use_count == 1))):
+                self._select_die(self._die2)
         
         if (self._move_state is MoveState.BEFORE_FROG
                 or self._move_state is MoveState.BEFORE_FROG_ERROR):
-            self._handle_potential_frog_click()
+            self._handle_potential_frog_click(mouse_pos)
+    
+    def _select_die(self, die):
+        # Select a die so that it can be used to move a frog, and start
+        # blinking its die indicator.
+        #
+        # Arguments:
+        #    die - the Die to select.
+        self._move_state = MoveState.BEFORE_FROG
+        self._selected_die = die
+        self._indicator_on = True
+        pygame.time.set_timer(Game._BLINK_EVENT, 500)
     
-    def _handle_potential_frog_click(self):
+    def _handle_potential_frog_click(self, mouse_pos):
         # Handle a "mouse button up" event in the MOVE turn stage and
         # BEFORE_FROG or BEFORE_FROG_ERROR move state by checking
         # for mouse collision with all frogs and performing the
         # appropriate action, which may include moving the frog. (Once
         # a frog is moved, no further frogs are checked.)
+        #
+        # Arguments:
+        #    mouse_pos - the position of the mouse when the event was
+        #        handled, as an (x, y) tuple.
         for frog in self._frogs:
-            if (not frog.is_moving() and frog.collision_rect.collidepoint(
-                    pygame.mouse.get_pos()) and frog.is_on_top()):
+            # Check for collision first since it rules out almost every
+            # frog and is cheaper than the other checks.
+            if (frog.collision_rect.collidepoint(mouse_pos)
+                    and not frog.is_moving() and frog.is_on_top()):
                 spaces = self._selected_die.state
                 if (frog.color == self._rolling_player
                         and frog.can_make_legal_leap(spaces)):
                     self._selected_die.use_count += 1
                     frog.stepwise_move(spaces)
                     self._selected_die = None
+                    pygame.time.set_timer(Game._BLINK_EVENT, 0)
                     self._move_state = MoveState.DURING_FROG_MOVEMENT
                     return
                 else:
@@ -286,13 +495,19 @@ class Game:
         # Arguments:
         #    text - a string representing one or more lines of text,
         #        with lines separated by newline characters.
-        self._window.draw_multi_line_text(
-            Game.BOARD_X - 280, Game.BOARD_Y + 10, text, "black")
+        #
+        # The text is only rendered the first time it is displayed;
+        # afterward, the cached Surface is drawn.
+        text_surface = self._text_cache.get(text)
+        if text_surface is None:
+            text_surface = self._window.render_multi_line_text(text, BLACK)
+            self._text_cache[text] = text_surface
+        self._window.draw_image(
+            Game.BOARD_X - 280, Game.BOARD_Y + 10, text_surface)
     
     def _get_die_indicator_color(self, die, indicator_no=1):
         # Return a string representing the Pygame color a die indicator
-        # should be drawn in after updating internal states related to
-        # that indicator if necessary.
+        # should be drawn in. Internal states are not updated.
         #
         # Arguments:
         #    die - the Die the indicator whose color is being checked
@@ -306,51 +521,25 @@ class Game:
         #    - Solid green: unused and unselected
         #    - Blinking red (alternating red and white): selected
         #    - Solid red: used
-        if self._doubles:
-            if die.use_count == 0:
-                if die == self._selected_die and indicator_no == 1:
-                    if self._indicator_timer.is_done():
-                        self._indicator_on = not self._indicator_on
-                        self._indicator_timer.stop()
-                        self._indicator_timer.start(500)
-                    if self._indicator_on:
-                        return "red"
-                    else:
-                        return "white"
-                else:
-                    return "green"
-            elif die.use_count == 1:
-                if die == self._selected_die and indicator_no == 2:
-                    if self._indicator_timer.is_done():
-                        self._indicator_on = not self._indicator_on
-                        self._indicator_timer.stop()
-                        self._indicator_timer.start(500)
-                    if self._indicator_on:
-                        return "red"
-                    else:
-                        return "white"
-                else:
-                    if indicator_no == 1:
-                        return "red"
-                    elif indicator_no == 2:
-                        return "green"
-            else:
+        #
+        # With doubles, a die's indicators are used up in order, so the
+        # indicator that blinks when the die is selected is the first
+        # one that has not been used yet.
+        if die is self._selected_die and (
+                not self._doubles or indicator_no == die.use_count + 1):
+            if self._indicator_on:
                 return "red"
-        else:
-            if die == self._selected_die:
-                if self._indicator_timer.is_done():
-                    self._indicator_on = not self._indicator_on
-                    self._indicator_timer.stop()
-                    self._indicator_timer.start(500)
-                if self._indicator_on:
-                    return "red"
-                else:
-                    return "white"
             else:
-                if die.use_count == 0:
-                    return "green"
-                else:
-                    return "red"
+                return "white"
+        
+        if self._doubles:
+            used = indicator_no <= die.use_count
+        else:
+            used = die.use_count > 0
+        if used:
+            return "red"
+        else:
+            return "green"
     
     def tick(self):
         """
@@ -359,30 +548,15 @@ class Game:
         Render everything onto the window, update the game based on its
         current states, handle events, and return whether or not the
         game should quit. Each call to this method comprises one frame
-        of the game; for optimal frame rate, this method should be
-        repeatedly called as quickly as possible (until it returns
-        True).
+        of the game; this method should be repeatedly called (until it
+        returns True), and will delay as needed so that the game runs
+        at no more than FRAME_RATE frames per second.
         """
-        self._window.fill("white")
-        
-        self._window.draw_image(
-            Game.BOARD_X, Game.BOARD_Y, self._resource_manager.images["board"])
-
-        # Draw the text box onto which messages for the players will be
-        # overlaid.
-        self._window.draw_rectangle(Game.BOARD_X - 290, Game.BOARD_Y,
-                                    260, 500, "yellow")
+        self._window.draw_background(self._background)
         
-        self._board.render_frogs(self._clock.tick())
+        self._board.render_frogs(self._clock.tick(Game.FRAME_RATE))
         
-        if self._state is State.SETUP:
-            self._tick_setup()
-        elif self._state is State.SETUP_TIE:
-            self._tick_setup_tie()
-        elif self._state is State.SETUP_WAITING:
-            self._tick_setup_waiting()
-        elif self._state is State.MAIN_GAME:
-            self._tick_main_game()
+        self._state_ticks[self._state]()
                         
         game_exit = self._handle_events()
         self._window.update()
@@ -392,7 +566,8 @@ class Game:
     def _tick_setup(self):
         # Render items onto the window and update the game in the SETUP
         # state.
-        self._die1.update()
+        if self._roll_state is RollState.DURING_ROLL:
+            self._die1.update()
         self._draw_die(1050, 260, self._die1)
         
         if self._rolling_player == "red":
@@ -402,11 +577,11 @@ class Game:
                 self._display_text("Hello, and welcome\nto Abagio! Red\n"
                                    "player, please roll for\nposition.")
             if self._roll_state is RollState.BEFORE_ROLL:
-                self._roll_button = self._window.draw_button(
-                    1050, 385, 100, 50, "Roll", "green", "black")
+                self._roll_button = self._window.draw_image(
+                    1050, 385, self._button_images["roll"])
             elif self._roll_state is RollState.DURING_ROLL:
-                self._roll_button = self._window.draw_button(
-                    1050, 385, 100, 50, "Stop", "red", "black")
+                self._roll_button = self._window.draw_image(
+                    1050, 385, self._button_images["stop"])
             elif self._roll_state is RollState.AFTER_ROLL:
                 self._has_rolled_before = True
                 self._rolls["red"] = self._die1.state
@@ -416,11 +591,11 @@ class Game:
         elif self._rolling_player == "purple":
             self._display_text("Purple player, please\nroll for position.")
             if self._roll_state is RollState.BEFORE_ROLL:
-                self._roll_button = self._window.draw_button(
-                    1050, 385, 100, 50, "Roll", "green", "black")
+                self._roll_button = self._window.draw_image(
+                    1050, 385, self._button_images["roll"])
             elif self._roll_state is RollState.DURING_ROLL:
-                self._roll_button = self._window.draw_button(
-                    1050, 385, 100, 50, "Stop", "red", "black")
+                self._roll_button = self._window.draw_image(
+                    1050, 385, self._button_images["stop"])
             elif self._roll_state is RollState.AFTER_ROLL:
                 self._rolls["purple"] = self._die1.state
                 self._rolling_player = "done"
@@ -432,50 +607,53 @@ class Game:
                 self._state = State.SETUP_TIE
             elif self._rolls["red"] > self._rolls["purple"]:
                 self._rolling_player = "red"
-                self._setup_timer = Timer(1000)
+                pygame.time.set_timer(Game._SETUP_WAITING_EVENT, 1000, 1)
                 self._state = State.SETUP_WAITING
             else:
                 self._rolling_player = "purple"
-                self._setup_timer = Timer(1000)
+                pygame.time.set_timer(Game._SETUP_WAITING_EVENT, 1000, 1)
                 self._state = State.SETUP_WAITING
     
     def _tick_setup_tie(self):
         # Render items onto the window and update the game in the
         # SETUP_TIE state.
-        self._die1.update()
         self._draw_die(1050, 260, self._die1)
         self._display_text("There was a tie!\nClick \"OK\" to\ncontinue.")
-        self._ok_button = self._window.draw_button(110, 585, 100, 50, "OK",
-                                                   "green", "black")
+        self._ok_button = self._window.draw_image(
+            110, 585, self._button_images["ok"])
     
     def _tick_setup_waiting(self):
         # Render items onto the window and update the game in the
         # SETUP_WAITING state.
-        self._die1.update()
         self._draw_die(1050, 260, self._die1)
         self._display_text("Purple player, please\nroll for position.")
+    
+    def _end_setup(self):
+        # Set up the board and start the main game once the pause at the
+        # end of the SETUP_WAITING state is over.
+        self._has_rolled_before = False
         
-        if self._setup_timer.is_done():
-            self._setup_timer.stop()
-            self._has_rolled_before = False
-            
-            if self._rolling_player == "red":
-                self._add_frogs("red", "purple")
-            else:
-                self._add_frogs("purple", "red")
-            
-            self._state = State.MAIN_GAME
-            self._turn_stage = TurnStage.ROLL
-            self._roll_state = RollState.BEFORE_ROLL
+        if self._rolling_player == "red":
+            self._add_frogs("red", "purple")
+        else:
+            self._add_frogs("purple", "red")
+        
+        self._state = State.MAIN_GAME
+        self._turn_stage = TurnStage.ROLL
+        self._roll_state = RollState.BEFORE_ROLL
     
     def _tick_main_game(self):
         # Render items onto the window and update the game in the
         # MAIN_GAME state.
-        self._die1.update()
-        self._die2.update()
+        if self._roll_state is RollState.DURING_ROLL:
+            self._die1.update()
+            self._die2.update()
         
-        self._die1_collision_rect = self._draw_die(973, 260, self._die1)
-        self._die2_collision_rect = self._draw_die(1126, 260, self._die2)
+        die_images = self._die_images
+        self._die1_collision_rect, self._die2_collision_rect = (
+            self._window.draw_images(
+                ((die_images[self._die1.state - 1], (973, 260)),
+                 (die_images[self._die2.state - 1], (1126, 260)))))
         
         if self._turn_stage is TurnStage.ROLL:
             self._tick_main_game_roll()
@@ -487,22 +665,16 @@ class Game:
         # Render items onto the window and update the game in the ROLL
         # turn stage in the MAIN_GAME state.
         if self._has_rolled_before:
-            self._display_text(self._rolling_player.capitalize()
-                               + " player, please\nroll.")
+            self._display_text(_ROLL_MESSAGES[self._rolling_player])
         else:
-            if self._rolling_player == "red":
-                self._display_text("Red player will\ngo first.\n\n"
-                                   "Red player, please\nroll.")
-            else:
-                self._display_text("Purple player will\ngo first.\n\n"
-                                   "Purple player, please\nroll.")
+            self._display_text(_FIRST_ROLL_MESSAGES[self._rolling_player])
         
         if self._roll_state is RollState.BEFORE_ROLL:
-            self._roll_button = self._window.draw_button(
-                1050, 385, 100, 50, "Roll", "green", "black")
+            self._roll_button = self._window.draw_image(
+                1050, 385, self._button_images["roll"])
         elif self._roll_state is RollState.DURING_ROLL:
-            self._roll_button = self._window.draw_button(
-                1050, 385, 100, 50, "Stop", "red", "black")
+            self._roll_button = self._window.draw_image(
+                1050, 385, self._button_images["stop"])
         elif self._roll_state is RollState.AFTER_ROLL:
             self._has_rolled_before = True
             self._turn_stage = TurnStage.MOVE
@@ -517,95 +689,56 @@ class Game:
         # turn stage in the MAIN_GAME state.
         
         # Render the die indicators.
+        images = self._indicator_images
+        indicator_color = self._get_die_indicator_color
         if self._doubles:
-            self._window.draw_circle(
-                1009, 380, 8,
-                self._get_die_indicator_color(self._die1, 1))
-            self._window.draw_circle(
-                1037, 380, 8,
-                self._get_die_indicator_color(self._die1, 2))
-            self._window.draw_circle(
-                1162, 380, 8,
-                self._get_die_indicator_color(self._die2, 1))
-            self._window.draw_circle(
-                1190, 380, 8,
-                self._get_die_indicator_color(self._die2, 2))
+            self._window.draw_images((
+                (images[indicator_color(self._die1, 1)], (1001, 372)),
+                (images[indicator_color(self._die1, 2)], (1029, 372)),
+                (images[indicator_color(self._die2, 1)], (1154, 372)),
+                (images[indicator_color(self._die2, 2)], (1182, 372))))
         else:
-            self._window.draw_circle(
-                1023, 380, 8,
-                self._get_die_indicator_color(self._die1))
-            self._window.draw_circle(
-                1176, 380, 8,
-                self._get_die_indicator_color(self._die2))
+            self._window.draw_images((
+                (images[indicator_color(self._die1)], (1015, 372)),
+                (images[indicator_color(self._die2)], (1168, 372))))
             
-        if self._move_state is MoveState.BEFORE_DIE:
-            self._tick_move_before_die()
-        elif self._move_state is MoveState.BEFORE_FROG:
-            self._tick_move_before_frog()
-        elif self._move_state is MoveState.BEFORE_FROG_ERROR:
-            self._tick_move_before_frog_error()
-        elif self._move_state is MoveState.DURING_FROG_MOVEMENT:
-            self._tick_move_during_frog_movement()
+        self._move_state_ticks[self._move_state]()
     
     def _tick_move_before_die(self):
         # Render items onto the window and update the game in the
         # BEFORE_DIE move state in the MOVE turn stage in the MAIN_GAME
         # state.
         if self._die1.use_count + self._die2.use_count == 0:
-            if self._doubles:
-                self._display_text("You rolled doubles!\nYou may use each\n"
-                                   + "die twice.\n\n"
-                                   + self._rolling_player.capitalize()
-                                   + " player, please\nclick on the die that\n"
-                                   + "you would like to use\nfirst.")
-            else:
-                self._display_text(self._rolling_player.capitalize()
-                                   + " player, please\nclick on the die that\n"
-                                   + "you would like to use\nfirst.")
+            self._display_text(
+                _FIRST_DIE_MESSAGES[self._rolling_player, self._doubles])
         else:
-            self._display_text(self._rolling_player.capitalize()
-                               + " player, please\nclick on the die that\nyou "
-                               + "would like to use\nnext.")
+            self._display_text(_NEXT_DIE_MESSAGES[self._rolling_player])
     
     def _tick_move_before_frog(self):
         # Render items onto the window and update the game in the
         # BEFORE_FROG move state in the MOVE turn stage in the
         # MAIN_GAME state.
         
-        # If both dice can still be selected...
-        if ((self._die1.use_count == 0 and self._die2.use_count == 0)
-                or (self._doubles and self._die1.use_count < 2
-                    and self._die2.use_count < 2)):
-            self._display_text(self._rolling_player.capitalize()
-                               + " player, please\nclick on the frog\nthat "
-                               + "you would like\nto move.\n\n"
-                               + "(You may also\nchange your die\nselection "
-                               + "if you\nwould like to.)")
-        else:
-            self._display_text(self._rolling_player.capitalize()
-                               + " player, please\nclick on the frog\nthat "
-                               + "you would like\nto move.")
+        # Whether or not both dice can still be selected
+        can_change_die = (
+            (self._die1.use_count == 0 and self._die2.use_count == 0)
+            or (self._doubles and self._die1.use_count < 2
+                and self._die2.use_count < 2))
+        self._display_text(
+            _FROG_MESSAGES[self._rolling_player, can_change_die])
     
     def _tick_move_before_frog_error(self):
         # Render items onto the window and update the game in the
         # BEFORE_FROG_ERROR move state in the MOVE turn stage in the
         # MAIN_GAME state.
         
-        # If both dice can still be selected...
-        if ((self._die1.use_count == 0 and self._die2.use_count == 0)
-                or (self._doubles and self._die1.use_count < 2
-                    and self._die2.use_count < 2)):
-            self._display_text("Invalid target. Please\ntry again.\n\n"
-                               + self._rolling_player.capitalize()
-                               + " player, please\nclick on the frog\nthat "
-                               + "you would like\nto move.\n\n"
-                               + "(You may also\nchange your die\nselection "
-                               + "if you\nwould like to.)")
-        else:
-            self._display_text("Invalid target. Please\ntry again.\n\n"
-                               + self._rolling_player.capitalize()
-                               + " player, please\nclick on the frog\n"
-                               + "that you would like\nto move.")
+        # Whether or not both dice can still be selected
+        can_change_die = (
+            (self._die1.use_count == 0 and self._die2.use_count == 0)
+            or (self._doubles and self._die1.use_count < 2
+                and self._die2.use_count < 2))
+        self._display_text(
+            _FROG_ERROR_MESSAGES[self._rolling_player, can_change_die])
     
     def _tick_move_during_frog_movement(self):
         # Render items onto the window and update the game in the
@@ -613,9 +746,8 @@ class Game:
         # MAIN_GAME state.
         self._display_text("Moving...")
 
-        for frog in self._frogs:
-            if frog.is_moving():
-                return
+        if self._board.moving_frog_count:
+            return
 
         # If no frog is moving and both dice are used up, reset for the
         # next turn.
@@ -641,73 +773,14 @@ class Game:
         #        representing the player who is going first.
         #    second_player - a string, either "red" or "purple",
         #        representing the player who is going second.
-        first_player_path_space_names = [
-            "sw", "1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11",
-            "12", "13", "14", "15", "16", "17", "18", "19"
-        ]
-        second_player_path_space_names = [
-            "se", "1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11",
-            "12", "13", "14", "15", "16", "17", "18", "19"
-        ]
-        if first_player == "red":
-            first_player_path_space_names += [
-                "20r", "21r", "22r", "23r", "24r", "25r", "26", "er"
-            ]
-            second_player_path_space_names += [
-                "20p", "21p", "22p", "23p", "24p", "25p", "26", "ep"
-            ]
-        else:
-            first_player_path_space_names += [
-                "20p", "21p", "22p", "23p", "24p", "25p", "26", "ep"
-            ]
-            second_player_path_space_names += [
-                "20r", "21r", "22r", "23r", "24r", "25r", "26", "er"
-            ]
+        players = (first_player, second_player)
+        paths = _PATH_SPACE_NAMES[first_player]
+        context = FrogContext(self._board, self._window, Game.BOARD_X,
+                              Game.BOARD_Y)
         
-        for _ in range(6):
-            self._frogs.append(Frog(first_player, "sw",
-                                    first_player_path_space_names, self._board,
-                                    self._window, Game.BOARD_X, Game.BOARD_Y))
-            self._frogs.append(Frog(second_player, "se",
-                                    second_player_path_space_names,
-                                    self._board, self._window, Game.BOARD_X,
-                                    Game.BOARD_Y))
-        self._frogs.append(Frog(first_player, "5",
-                                first_player_path_space_names, self._board,
-                                self._window, Game.BOARD_X, Game.BOARD_Y))
-        self._frogs.append(Frog(second_player, "5",
-                                second_player_path_space_names, self._board,
-                                self._window, Game.BOARD_X, Game.BOARD_Y))
-        self._frogs.append(Frog(first_player, "5",
-                                first_player_path_space_names, self._board,
-                                self._window, Game.BOARD_X, Game.BOARD_Y))
-        self._frogs.append(Frog(second_player, "5",
-                                second_player_path_space_names, self._board,
-                                self._window, Game.BOARD_X, Game.BOARD_Y))
-        self._frogs.append(Frog(second_player, "10",
-                                second_player_path_space_names, self._board,
-                                self._window, Game.BOARD_X, Game.BOARD_Y))
-        self._frogs.append(Frog(first_player, "10",
-                                first_player_path_space_names, self._board,
-                                self._window, Game.BOARD_X, Game.BOARD_Y))
-        self._frogs.append(Frog(second_player, "10",
-                                second_player_path_space_names, self._board,
-                                self._window, Game.BOARD_X, Game.BOARD_Y))
-        self._frogs.append(Frog(first_player, "10",
-                                first_player_path_space_names, self._board,
-                                self._window, Game.BOARD_X, Game.BOARD_Y))
-        self._frogs.append(Frog(first_player, "15",
-                                first_player_path_space_names, self._board,
-                                self._window, Game.BOARD_X, Game.BOARD_Y))
-        self._frogs.append(Frog(second_player, "15",
-                                second_player_path_space_names, self._board,
-                                self._window, Game.BOARD_X, Game.BOARD_Y))
-        self._frogs.append(Frog(first_player, "15",
-                                first_player_path_space_names, self._board,
-                                self._window, Game.BOARD_X, Game.BOARD_Y))
-        self._frogs.append(Frog(second_player, "15",
-                                second_player_path_space_names, self._board,
-                                self._window, Game.BOARD_X, Game.BOARD_Y))
+        self._frogs = [
+            Frog(players[player], space_name, paths[player], context)
+            for player, space_name in _FROG_LAYOUT]
     
     def _draw_die(self, x, y, die):
         # Draw a die onto the window and return its bounding box as a
@@ -719,8 +792,7 @@ class Game:
         #    y - the desired y coordinate of the top-left corner of the
         #        die in the window.
         #    die - the Die to be drawn.
-        return self._window.draw_image(
-            x, y, self._resource_manager.images["die " + str(die.state)])
+        return self._window.draw_image(x, y, self._die_images[die.state - 1])
     
     def run(self):
         """
@@ -735,7 +807,7 @@ class Game:
         while not game_exit:
             game_exit = self.tick()
         
-        self.quit_game()
+        pygame.quit()
     
     def quit_game(self):
         """
@@ -6,11 +6,37 @@ Classes:
     Board - an Abagio game board.
     Space - a space on an Abagio game board.
     Frog - a frog in the Abagio game.
+    FrogContext - the board, window, and offsets shared by frogs.
 """
 
+from collections import namedtuple
 import random
+from types import MappingProxyType
 
-from abagio.timer import Timer
+import pygame
+
+
+# A dictionary from each frog color to the integer used to identify it
+# when comparing the colors of frogs.
+_COLOR_IDS = {"red": 0, "purple": 1}
+
+# The spaces on an Abagio game board, as tuples of the name, capacity,
+# x coordinate, and y coordinate of each space.
+_SPACE_DEFS = (
+    ("sw", 12, 52, 548), ("se", 12, 147, 548),
+    ("1", 5, 52, 450), ("2", 5, 52, 350), ("3", 5, 52, 250),
+    ("4", 5, 52, 150), ("5", 5, 52, 52), ("6", 5, 150, 52),
+    ("7", 5, 250, 52), ("8", 5, 350, 52), ("9", 5, 450, 52),
+    ("10", 5, 548, 52), ("11", 5, 548, 150), ("12", 5, 548, 250),
+    ("13", 5, 548, 350), ("14", 5, 548, 450), ("15", 5, 548, 548),
+    ("16", 5, 450, 548), ("17", 5, 350, 548), ("18", 5, 252, 548),
+    ("19", 2, 300, 500),
+    ("20r", 5, 248, 446), ("21r", 5, 154, 446), ("22r", 5, 154, 350),
+    ("23r", 5, 154, 250), ("24r", 5, 154, 154), ("25r", 5, 248, 154),
+    ("20p", 5, 352, 446), ("21p", 5, 446, 446), ("22p", 5, 446, 350),
+    ("23p", 5, 446, 250), ("24p", 5, 446, 154), ("25p", 5, 352, 154),
+    ("26", 2, 299, 199), ("er", 12, 248, 350), ("ep", 12, 352, 350),
+)
 
 
 class Die:
@@ -40,9 +66,23 @@ class Die:
     """
     
     # Non-public instance variables:
-    #    _timer - the Timer used to keep track of whether a sufficient
-    #        amount of time has passed for the die's state to be
-    #        updated.
+    #    _deadline - the timestamp, as obtained from pygame.time's
+    #        get_ticks() method, at which a sufficient amount of time
+    #        will have passed for the die's state to be updated. -1 if
+    #        the die is not rolling.
+    #    _random - the die's own random.Random instance, used to pick
+    #        the numbers it shows.
+    
+    # Non-public class constants:
+    #    _NEXT_STATES - a tuple whose item at index n (for n from 1 to
+    #        6) is a tuple of the states a die showing n can change to
+    #        when it is updated (every state other than n). The item at
+    #        index 0 is unused.
+    
+    _NEXT_STATES = (None, (2, 3, 4, 5, 6), (1, 3, 4, 5, 6), (1, 2, 4, 5, 6),
+                    (1, 2, 3, 5, 6), (1, 2, 3, 4, 6), (1, 2, 3, 4, 5))
+    
+    __slots__ = ("state", "speed", "_deadline", "_random", "use_count")
     
     def __init__(self, state=None, speed=75):
         """
@@ -58,19 +98,18 @@ class Die:
         
         The die starts out not rolling, and the use count starts at 0.
         """
+        self._random = random.Random()
         if state is None:
-            state = random.randint(1, 6)
+            state = self._random.randrange(1, 7)
         self.state = state
         self.speed = speed
-        self._timer = Timer()
+        self._deadline = -1
         self.use_count = 0
     
     def _update_state(self):
         # Set the die's state to a random integer from 1 to 6 other
         # than its current state.
-        possible_states = [1, 2, 3, 4, 5, 6]
-        possible_states.remove(self.state)
-        self.state = random.choice(possible_states)
+        self.state = Die._NEXT_STATES[self.state][self._random.randrange(5)]
 
     def start_roll(self):
         """
@@ -84,7 +123,7 @@ class Die:
         roll does not need to be stopped in order to be started again.
         """
         self._update_state()
-        self._timer.start(self.speed)
+        self._deadline = pygame.time.get_ticks() + self.speed
     
     def update(self):
         """
@@ -98,7 +137,7 @@ class Die:
         current state, and restart the roll using the current speed
         value.
         """
-        if self._timer.is_done():
+        if self._deadline != -1 and pygame.time.get_ticks() >= self._deadline:
             self.start_roll()
     
     def stop_roll(self):
@@ -108,22 +147,28 @@ class Die:
         Note that this does not update the die's state again after the
         die was last updated.
         """
-        self._timer.stop()
+        self._deadline = -1
 
 
 class Board:
     """
     A representation of an Abagio game board and its spaces and frogs.
     
-    Methods: add, render_frogs
+    Methods: add, iter_frogs, path, render_frogs, frog_started_moving,
+        frog_stopped_moving
     
     Instance variables:
         frogs - the list of Frogs on the board. (read-only property)
-        spaces - a dictionary from the name of each space on the board
-            to the Space object it is represented by. (read-only
+        spaces - a read-only mapping from the name of each space on the
+            board to the Space object it is represented by. (read-only
             property)
+        moving_frog_count - the number of frogs on the board that are
+            currently moving. (read-only property)
     """
     
+    __slots__ = ("_frogs", "_render_order", "_moving_frog_count", "_spaces",
+                 "_spaces_view", "_paths", "_frog_indices")
+    
     def __init__(self):
         """
         Create the board.
@@ -132,44 +177,20 @@ class Board:
         game board. There are initially no frogs on the board.
         """
         self._frogs = []
-        self._spaces = {
-            "sw": Space("sw", 12, 52, 548),
-            "se": Space("se", 12, 147, 548),
-            "1": Space("1", 5, 52, 450),
-            "2": Space("2", 5, 52, 350),
-            "3": Space("3", 5, 52, 250),
-            "4": Space("4", 5, 52, 150),
-            "5": Space("5", 5, 52, 52),
-            "6": Space("6", 5, 150, 52),
-            "7": Space("7", 5, 250, 52),
-            "8": Space("8", 5, 350, 52),
-            "9": Space("9", 5, 450, 52),
-            "10": Space("10", 5, 548, 52),
-            "11": Space("11", 5, 548, 150),
-            "12": Space("12", 5, 548, 250),
-            "13": Space("13", 5, 548, 350),
-            "14": Space("14", 5, 548, 450),
-            "15": Space("15", 5, 548, 548),
-            "16": Space("16", 5, 450, 548),
-            "17": Space("17", 5, 350, 548),
-            "18": Space("18", 5, 252, 548),
-            "19": Space("19", 2, 300, 500),
-            "20r": Space("20r", 5, 248, 446),
-            "21r": Space("21r", 5, 154, 446),
-            "22r": Space("22r", 5, 154, 350),
-            "23r": Space("23r", 5, 154, 250),
-            "24r": Space("24r", 5, 154, 154),
-            "25r": Space("25r", 5, 248, 154),
-            "20p": Space("20p", 5, 352, 446),
-            "21p": Space("21p", 5, 446, 446),
-            "22p": Space("22p", 5, 446, 350),
-            "23p": Space("23p", 5, 446, 250),
-            "24p": Space("24p", 5, 446, 154),
-            "25p": Space("25p", 5, 352, 154),
-            "26": Space("26", 2, 299, 199),
-            "er": Space("er", 12, 248, 350),
-            "ep": Space("ep", 12, 352, 350),
-        }
+        # The frogs in the order they were last rendered in, kept so
+        # that it can be re-sorted in place each frame (which is fast
+        # since it is usually already sorted or nearly so).
+        self._render_order = []
+        # The index of each frog in _frogs, used to break ties between
+        # frogs with the same render priority.
+        self._frog_indices = {}
+        self._moving_frog_count = 0
+        self._spaces = {name: Space(name, capacity, x, y)
+                        for name, capacity, x, y in _SPACE_DEFS}
+        self._spaces_view = MappingProxyType(self._spaces)
+        # The paths built by the path method, keyed by the tuple of
+        # space names they were built from.
+        self._paths = {}
     
     @property
     def frogs(self):
@@ -184,13 +205,25 @@ class Board:
     @property
     def spaces(self):
         """
-        Get a copy of the dictionary of the spaces on the board.
+        Get a read-only view of the dictionary of the board's spaces.
         
-        Get a shallow copy of the dictionary from the name of each
-        space on the board to the Space object it is represented by.
+        Get a read-only mapping (which is not a copy, so does not need
+        to be rebuilt on each access) from the name of each space on
+        the board to the Space object it is represented by. (read-only
+        property)
+        """
+        return self._spaces_view
+    
+    @property
+    def moving_frog_count(self):
+        """
+        Get the number of frogs on the board that are moving.
+        
+        Kept up to date by the frogs themselves as they start and stop
+        moving, so checking it does not require looping over the frogs.
         (read-only property)
         """
-        return self._spaces.copy()
+        return self._moving_frog_count
     
     def add(self, frog):
         """
@@ -203,7 +236,42 @@ class Board:
         Note that this does not automatically add the frog to any Space
         on the board.
         """
+        self._frog_indices[frog] = len(self._frogs)
         self._frogs.append(frog)
+        self._render_order.append(frog)
+    
+    def iter_frogs(self):
+        """
+        Return an iterator over the frogs on the board.
+        
+        Unlike the frogs property, this does not copy the list of frogs,
+        so frogs must not be added to the board while iterating.
+        """
+        return iter(self._frogs)
+    
+    def path(self, space_names):
+        """
+        Return a path of spaces on the board and an index into it.
+        
+        Return a (path, index) tuple, where path is a tuple of the
+        Spaces on the board with the given names, in the same order,
+        and index is a dictionary mapping each of those Spaces to its
+        index in path. Both are built only the first time a given
+        sequence of names is requested and are shared by every caller
+        after that, so neither must be modified.
+        
+        Arguments:
+            space_names - an ordered sequence (such as a list or tuple)
+                of the names of spaces on the board, as strings.
+        """
+        space_names = tuple(space_names)
+        try:
+            return self._paths[space_names]
+        except KeyError:
+            path = tuple(self._spaces[name] for name in space_names)
+            self._paths[space_names] = (
+                path, {space: i for i, space in enumerate(path)})
+            return self._paths[space_names]
     
     def render_frogs(self, dt):
         """
@@ -211,20 +279,41 @@ class Board:
         
         The update_render_priority method is called on all frogs on the
         board, and the frogs are rendered from low to high render
-        priority.
+        priority. Frogs with the same render priority are rendered in
+        the order they were added to the board.
         
         Arguments:
             dt - the difference between the current time and the time
                 when the frogs' coordinates were last updated (which
                 occurs when the frogs are rendered), in milliseconds.
         """
-        for frog in self._frogs:
-            frog.update_render_priority()
-        
-        sorted_frogs = sorted(self._frogs,
-                              key=lambda frg: frg.render_priority)
-        for frog in sorted_frogs:
+        # Updating the render priorities as the sort key does both in a
+        # single pass over the frogs. Since the render order is kept
+        # from the previous frame, ties are broken explicitly rather
+        # than being left in whatever order that frame had them in.
+        indices = self._frog_indices
+        self._render_order.sort(
+            key=lambda frog: (frog.update_render_priority(), indices[frog]))
+        for frog in self._render_order:
             frog.render(dt)
+    
+    def frog_started_moving(self):
+        """
+        Record that one of the board's frogs has started moving.
+        
+        Called by the frogs on the board; should not otherwise need to
+        be called.
+        """
+        self._moving_frog_count += 1
+    
+    def frog_stopped_moving(self):
+        """
+        Record that one of the board's frogs has stopped moving.
+        
+        Called by the frogs on the board; should not otherwise need to
+        be called.
+        """
+        self._moving_frog_count -= 1
 
 
 class Space:
@@ -248,6 +337,11 @@ class Space:
     # Non-public instance variables:
     #    _frogs - the list of frogs currently occupying the space,
     #        from bottom to top with no gaps.
+    #    _frog_color_ids - the list of the color ids of the frogs in
+    #        _frogs, in the same order, so that the colors at the top
+    #        of the stack can be compared without looking at the frogs.
+    
+    __slots__ = ("name", "_capacity", "x", "y", "_frogs", "_frog_color_ids")
     
     def __init__(self, name, capacity, x, y):
         """
@@ -272,6 +366,7 @@ class Space:
         self.x = x
         self.y = y
         self._frogs = []
+        self._frog_color_ids = []
     
     @property
     def capacity(self):
@@ -295,12 +390,14 @@ class Space:
         Arguments:
             frog - the Frog to be added.
         """
-        layer = len(self._frogs)
+        frogs = self._frogs
+        layer = len(frogs)
         if layer >= self._capacity:
             raise RuntimeError("a new frog cannot be added to the stack - it "
                                "is already full")
         
-        self._frogs.append(frog)
+        frogs.append(frog)
+        self._frog_color_ids.append(frog._color_id)
         return layer
 
     def lowest_empty_layer(self):
@@ -325,11 +422,13 @@ class Space:
         and return the popped Frog. A RuntimeError is raised if the
         space is empty.
         """
-        if len(self._frogs) == 0:
+        frogs = self._frogs
+        if len(frogs) == 0:
             raise RuntimeError("the stack is empty, so a frog cannot be "
                                "popped from it")
 
-        return self._frogs.pop()
+        self._frog_color_ids.pop()
+        return frogs.pop()
     
     def pop_verify(self, frog):
         """
@@ -347,6 +446,7 @@ class Space:
             raise RuntimeError("the specified frog is not at the top of the "
                                "stack")
         
+        self._frog_color_ids.pop()
         return self._frogs.pop()
     
     def is_on_top(self, frog):
@@ -356,7 +456,8 @@ class Space:
         Arguments:
             frog - the Frog object to check.
         """
-        return len(self._frogs) > 0 and self._frogs[-1] is frog
+        frogs = self._frogs
+        return len(frogs) > 0 and frogs[-1] is frog
     
     def can_legally_take(self, frog):
         """
@@ -372,13 +473,16 @@ class Space:
         Arguments:
             frog - the Frog object to check.
         """
-        if len(self._frogs) >= 3:
-            highest_frog = self._frogs[-1]
-            if (highest_frog.color != frog.color
-                    and highest_frog.color == self._frogs[-2].color
-                    and highest_frog.color == self._frogs[-3].color):
+        color_ids = self._frog_color_ids
+        if len(color_ids) >= self._capacity:
+            return False
+        if len(color_ids) >= 3:
+            highest_color_id = color_ids[-1]
+            if (highest_color_id != frog._color_id
+                    and highest_color_id == color_ids[-2]
+                    and highest_color_id == color_ids[-3]):
                 return False
-        return len(self._frogs) < self._capacity
+        return True
     
     def send_frogs_home(self):
         """
@@ -398,23 +502,22 @@ class Space:
         stack (unless the send_home call causes any of these actions to
         be performed).
         """
-        if len(self._frogs) >= 2:
-            sending_frog_home = False
-            highest_frog = self._frogs[-1]
-            send_home_frog = self._frogs[-2]
-            if len(self._frogs) >= 3:
-                if (highest_frog.color != send_home_frog.color
-                        and send_home_frog.color != self._frogs[-3].color):
-                    sending_frog_home = True
-            else:
-                if highest_frog.color != send_home_frog.color:
-                    sending_frog_home = True
-            
-            if sending_frog_home:
-                for frog in self._frogs:
-                    frog.render_priority_offset = 50
-                highest_frog.render_priority_offset += 1
-                send_home_frog.send_home()
+        frogs = self._frogs
+        color_ids = self._frog_color_ids
+        num_frogs = len(frogs)
+        if num_frogs < 2:
+            return
+        
+        # The second-highest frog is a blot being hit if it is a
+        # different color than the highest frog and is not on top of a
+        # frog of its own color.
+        send_home_color_id = color_ids[-2]
+        if (color_ids[-1] != send_home_color_id
+                and (num_frogs < 3 or send_home_color_id != color_ids[-3])):
+            for i in range(num_frogs - 1):
+                frogs[i].render_priority_offset = 50
+            frogs[-1].render_priority_offset = 51
+            frogs[-2].send_home()
     
     def pull_out(self, frog):
         """
@@ -429,13 +532,18 @@ class Space:
         Arguments:
             frog - the Frog object to remove.
         """
+        frogs = self._frogs
         try:
-            idx = self._frogs.index(frog)
-            del self._frogs[idx]
-            for fg in self._frogs[idx:]:
-                fg.shift_down()
+            idx = frogs.index(frog)
         except ValueError:
             raise ValueError("the specified frog is not in the stack")
+        
+        del frogs[idx]
+        del self._frog_color_ids[idx]
+        # Index into the list rather than iterating over a slice of it,
+        # so that no copy of the frogs above is made.
+        for i in range(idx, len(frogs)):
+            frogs[i].shift_down()
 
 
 class Frog:
@@ -495,12 +603,25 @@ class Frog:
     """
     
     # Non-public instance variables:
-    #    _board - the Board the frog is a part of.
+    #    _color_id - the integer identifying the frog's color, used
+    #        (including by Space) to compare frogs' colors cheaply.
+    #    _context - the FrogContext holding the Board the frog is a part
+    #        of, the Window it should be rendered onto, and the offsets
+    #        to add to the coordinates of the space it is on.
     #    _space - the Space the frog is on (is updated internally at
     #        varying times when the frog moves).
-    #    _path - the ordered list of spaces the frog will traverse
-    #        around the board.
-    #    _window - the Window the frog should be rendered onto.
+    #    _space_x - the x coordinate of the center of the space the
+    #        frog is on in the window (the space's x coordinate plus the
+    #        x offset). Updated along with _space.
+    #    _space_y - the y coordinate of the center of the space the
+    #        frog is on in the window (the space's y coordinate plus the
+    #        y offset). Updated along with _space.
+    #    _path - the ordered tuple of spaces the frog will traverse
+    #        around the board (shared with other frogs on the same
+    #        path).
+    #    _path_index - a dict mapping each Space on the frog's path to
+    #        its index in _path (shared like _path).
+    #    _space_index - the index of _space in _path.
     #    _is_being_sent_home - whether or not the frog is currently
     #        being sent / moving back to the root.
     #    _x_target - the x coordinate of the position the frog is
@@ -530,14 +651,6 @@ class Frog:
     #        engaged in stepwise movement - a type of movement that
     #        allows a frog to move toward a final destination space by
     #        moving directly to each space along the way, one at a time.
-    #    _x_offset - the offset that should be added to the x coordinate
-    #        of the space the frog is on when determining the x
-    #        coordinate of the frog, to account for the location of the
-    #        board in the display window.
-    #    _y_offset - the offset that should be added to the y coordinate
-    #        of the space the frog is on when determining the y
-    #        coordinate of the frog, to account for the location of the
-    #        board in the display window.
 
     # Non-public class constants:
     #    _LAYER_SPACING - the difference in y coordinate between frogs
@@ -547,8 +660,15 @@ class Frog:
     DISPLAY_RADIUS = 20
     _LAYER_SPACING = 10
     
-    def __init__(self, color, starting_space_name, path_space_names, board,
-                 window, x_offset, y_offset):
+    __slots__ = ("_color", "_color_id", "_context", "_space", "_space_x",
+                 "_space_y", "_path", "_path_index", "_space_index", "_layer",
+                 "collision_rect", "_is_being_sent_home", "_x", "_x_target",
+                 "_x_move", "_y", "_y_target", "_y_move", "_target_space",
+                 "_stepwise_movement", "render_priority",
+                 "render_priority_offset")
+    
+    def __init__(self, color, starting_space_name, path_space_names,
+                 context):
         """
         Create the frog.
         
@@ -558,23 +678,18 @@ class Frog:
                 it belongs to). Must be either "red" or "purple".
             starting_space_name - the name of the space on the frog's
                 board that the frog should start on (as a string).
-            path_space_names - an ordered list of the names of the
-                spaces on the frog's board the frog should be able to
-                traverse (i.e., the list of the names of the spaces on
-                the frog's board the frog should be allowed to travel
-                on, ordered from the beginning to the end of the
-                board), as strings.
-            board - the Board the frog should be a part of.
-            window - the Window the frog should be rendered onto when
-                the render method is called.
-            x_offset - the offset that should be added to the x
-                coordinate of the space the frog is on when determining
-                the x coordinate of the frog, to account for the
-                location of the board in the display window.
-            y_offset - the offset that should be added to the y
-                coordinate of the space the frog is on when determining
-                the y coordinate of the frog, to account for the
-                location of the board in the display window.
+            path_space_names - an ordered sequence (such as a list or
+                tuple) of the names of the spaces on the frog's board
+                the frog should be able to traverse (i.e., the names of
+                the spaces on the frog's board the frog should be
+                allowed to travel on, ordered from the beginning to the
+                end of the board), as strings.
+            context - the FrogContext holding the Board the frog should
+                be a part of, the Window it should be rendered onto
+                when the render method is called, and the offsets to
+                add to the coordinates of the space it is on. A single
+                context can (and should) be shared by all of the frogs
+                in a game.
         
         The frog is added to the specified board and to the top of the
         stack on the space on that board whose name matches the
@@ -588,25 +703,21 @@ class Frog:
         specified space because the space is already full.
         """
         self._color = color
-        self._board = board
-        self._board.add(self)
-        self._space = self._board.spaces[starting_space_name]
-        self._path = [self._board.spaces[space_name]
-                      for space_name in path_space_names]
+        self._color_id = _COLOR_IDS[color]
+        self._context = context
+        context.board.add(self)
+        self._path, self._path_index = context.board.path(path_space_names)
+        self._set_space(context.board.spaces[starting_space_name])
         self._layer = self._space.add(self)
-        self._window = window
-        self._x_offset = x_offset
-        self._y_offset = y_offset
         self.collision_rect = None
         self._is_being_sent_home = False
 
-        self._x = self._space.x + self._x_offset
+        self._x = self._space_x
         self._x_target = self._x
         self._x_move = 0
         # Frogs at adjacent layers of the same space are separated by
         # 10 pixels.
-        self._y = (self._space.y + self._y_offset
-                   - self._layer * Frog._LAYER_SPACING)
+        self._y = self._space_y - self._layer * Frog._LAYER_SPACING
         self._y_target = self._y
         self._y_move = 0
         self._target_space = self._space
@@ -671,53 +782,40 @@ class Frog:
                 when the update_coords or render method is called), in
                 milliseconds.
         """
-        # Calculate the signed x amount and y amount that the frog
-        # should move this frame.
+        was_moving = self.is_moving()
+        # There is nothing to do for a frog that is sitting still (which
+        # most of them are at any given time), unless it has just been
+        # told to move to where it already is.
+        if not (was_moving or self._is_being_sent_home
+                or self._stepwise_movement):
+            return
+        
+        # Move the frog by the signed x amount and y amount it should
+        # move this frame, making sure it doesn't overshoot its target.
         x_move_dt = self._x_move * dt
-        y_move_dt = self._y_move * dt
-        
-        # Make sure the frog doesn't overshoot its target in x.
         if x_move_dt >= 0:
-            if self._x + x_move_dt >= self._x_target:
-                self._x = self._x_target
-                finished_one_space_x_movement = True
-            else:
-                self._x += x_move_dt
-                finished_one_space_x_movement = False
+            self._x = min(self._x + x_move_dt, self._x_target)
         else:
-            if self._x + x_move_dt <= self._x_target:
-                self._x = self._x_target
-                finished_one_space_x_movement = True
-            else:
-                self._x += x_move_dt
-                finished_one_space_x_movement = False
-        
-        # Make sure the frog doesn't overshoot its target in y.
+            self._x = max(self._x + x_move_dt, self._x_target)
+        y_move_dt = self._y_move * dt
         if y_move_dt >= 0:
-            if self._y + y_move_dt >= self._y_target:
-                self._y = self._y_target
-                finished_one_space_y_movement = True
-            else:
-                self._y += y_move_dt
-                finished_one_space_y_movement = False
+            self._y = min(self._y + y_move_dt, self._y_target)
         else:
-            if self._y + y_move_dt <= self._y_target:
-                self._y = self._y_target
-                finished_one_space_y_movement = True
-            else:
-                self._y += y_move_dt
-                finished_one_space_y_movement = False
+            self._y = max(self._y + y_move_dt, self._y_target)
+        
+        if was_moving and not self.is_moving():
+            self._context.board.frog_stopped_moving()
         
         # If the frog has made it one space...
-        if finished_one_space_x_movement and finished_one_space_y_movement:
+        if self._x == self._x_target and self._y == self._y_target:
             if self._is_being_sent_home:
                 self._is_being_sent_home = False
-                self._space = self._target_space
+                self._set_space(self._target_space)
                 self._layer = self._space.add(self)
                 # When a frog being sent home reaches the root, all
                 # frogs on the same board have their render priority
                 # offset reset to 0.
-                for frog in self._board.frogs:
+                for frog in self._context.board.iter_frogs():
                     frog.render_priority_offset = 0
             
             if self._stepwise_movement:
@@ -725,7 +823,7 @@ class Frog:
                     self._space.send_frogs_home()
                     self._stepwise_movement = False
                 else:
-                    self.direct_space_move(self._increment_space(1))
+                    self.direct_space_move(self._path[self._space_index + 1])
         
     def render(self, dt):
         """
@@ -743,10 +841,26 @@ class Frog:
                 when the update_coords or render method is called), in
                 milliseconds.
         """
-        self.update_coords(dt)
-        self.collision_rect = self._window.draw_frog(
+        # Skip the call entirely for the (many) frogs sitting still;
+        # this is the same check update_coords starts with.
+        if (self._x != self._x_target or self._y != self._y_target
+                or self._is_being_sent_home or self._stepwise_movement):
+            self.update_coords(dt)
+        self.collision_rect = self._context.window.draw_frog(
             int(self._x), int(self._y), Frog.DISPLAY_RADIUS, self._color)
     
+    def _set_space(self, space):
+        # Set the Space the frog is on, along with its index on the
+        # frog's path and the window coordinates of its center.
+        #
+        # Arguments:
+        #    space - the Space the frog is now on. Must be on the frog's
+        #        path.
+        self._space = space
+        self._space_index = self._path_index[space]
+        self._space_x = space.x + self._context.x_offset
+        self._space_y = space.y + self._context.y_offset
+    
     def _increment_space(self, increment, current_space=None):
         # Return the Space that is increment spaces after current_space
         # on the frog's path, or None if the increment is too high.
@@ -758,9 +872,9 @@ class Frog:
         #    current_space - the space to start at. If not provided or
         #        None, the value of self._space is used.
         if current_space is None:
-            current_space = self._space
-        
-        new_space_index = self._path.index(current_space) + increment
+            new_space_index = self._space_index + increment
+        else:
+            new_space_index = self._path_index[current_space] + increment
         if new_space_index >= len(self._path):
             return None
         else:
@@ -794,14 +908,15 @@ class Frog:
         but is not on the top of its stack.
         
         Arguments:
-            space - the Space the frog should move to.
+            space - the Space the frog should move to. Must be on the
+                frog's path.
         """
         
         # If the frog is in a temporary layer, there is no need to pop
         # since it is not included in any Space's list of frogs.
         if self._layer < self._space.capacity:
             self._space.pop_verify(self)
-        self._space = space
+        self._set_space(space)
         self._layer = self._space.lowest_empty_layer()
         if self._layer is None:
             # If the space is full (which should only potentially occur
@@ -818,8 +933,7 @@ class Frog:
         # Frogs at adjacent layers of the same space are separated by 10
         # pixels.
         self._direct_coords_move(
-            self._space.x + self._x_offset,
-            self._space.y + self._y_offset - self._layer * Frog._LAYER_SPACING)
+            self._space_x, self._space_y - self._layer * Frog._LAYER_SPACING)
     
     def _direct_coords_move(self, x_target, y_target):
         # Initiate direct movement to the given x and y coordinates by
@@ -837,36 +951,31 @@ class Frog:
         #        should move to.
         #    y_target - the y coordinate of the position the frog
         #        should move to.
+        was_moving = self.is_moving()
         self._x_target = x_target
         self._y_target = y_target
         
-        # If the frog is already at the correct x position, move in a
-        # straight vertical line toward the y target. A special case is
-        # needed to avoid division by 0.
-        if self._x_target - self._x == 0:
-            self._x_move = 0
-            if self._y_target >= self._y:
-                self._y_move = Frog.PIXELS_PER_MS
+        # Keep the board's count of moving frogs up to date.
+        if self.is_moving() != was_moving:
+            if was_moving:
+                self._context.board.frog_stopped_moving()
             else:
-                self._y_move = - Frog.PIXELS_PER_MS
+                self._context.board.frog_started_moving()
+        
+        # Scale the vector to the target down to the frog's speed; its
+        # components then carry the correct signs. A frog that is
+        # already at its target does not need to move at all.
+        x_distance = self._x_target - self._x
+        y_distance = self._y_target - self._y
+        distance = (x_distance * x_distance
+                    + y_distance * y_distance) ** 0.5
+        if distance == 0:
+            self._x_move = 0
+            self._y_move = 0
         else:
-            # It is impossible for the large denominator to be 0
-            # because that would require
-            # ((y_target - y) / (x_target - x)) ^ 2 to equal -1.
-            self._x_move = (
-                ((Frog.PIXELS_PER_MS * Frog.PIXELS_PER_MS)
-                 / (1 + (((self._y_target - self._y)
-                          / (self._x_target - self._x))
-                    * ((self._y_target - self._y)
-                       / (self._x_target - self._x))))) ** 0.5)
-            self._y_move = abs(((self._y_target - self._y)
-                                / (self._x_target - self._x)) * self._x_move)
-            
-            # Make x_move and y_move appropriately signed.
-            if self._x_target < self._x:
-                self._x_move *= -1
-            if self._y_target < self._y:
-                self._y_move *= -1
+            scale = Frog.PIXELS_PER_MS / distance
+            self._x_move = x_distance * scale
+            self._y_move = y_distance * scale
 
     def stepwise_move(self, spaces_to_move):
         """
@@ -904,7 +1013,7 @@ class Frog:
             raise ValueError("the provided spaces_to_move value would bring "
                              "the frog out of bounds")
         self._stepwise_movement = True
-        self.direct_space_move(self._increment_space(1))
+        self.direct_space_move(self._path[self._space_index + 1])
         
     def is_moving(self):
         """
@@ -952,22 +1061,24 @@ class Frog:
     
     def update_render_priority(self):
         """
-        Update the frog's render_priority field with a new calculation.
+        Update the frog's render_priority field and return its value.
         
         Calculate the frog's render priority according to the standard
         render priority calculation: add the frog's current layer to
         its render priority offset, and add another 100 to the render
         priority if the frog is moving but is not being sent home.
         Then, set the frog's render_priority field to the result of
-        this calculation. This calculation is sufficient to ensure that
-        frog stacks and moving frogs are displayed correctly as long as
-        the Space class correctly updates render priority offsets when
-        a frog is sent home and frogs are rendered from LOW TO HIGH
-        render priority.
+        this calculation, and return it (so that this method can be
+        used as a sort key). This calculation is sufficient to ensure
+        that frog stacks and moving frogs are displayed correctly as
+        long as the Space class correctly updates render priority
+        offsets when a frog is sent home and frogs are rendered from
+        LOW TO HIGH render priority.
         """
         self.render_priority = self._layer + self.render_priority_offset
         if self.is_moving() and not self._is_being_sent_home:
             self.render_priority += 100
+        return self.render_priority
     
     def send_home(self):
         """
@@ -1001,8 +1112,8 @@ class Frog:
         # Frogs at adjacent layers of the same space are separated by 10
         # pixels.
         self._direct_coords_move(
-            self._target_space.x + self._x_offset,
-            self._target_space.y + self._y_offset
+            self._target_space.x + self._context.x_offset,
+            self._target_space.y + self._context.y_offset
             - (self._target_space.lowest_empty_layer() * Frog._LAYER_SPACING))
     
     def shift_down(self):
@@ -1022,3 +1133,30 @@ class Frog:
         """
         self._layer -= 1
         self._direct_coords_move(self.x, self.y + Frog._LAYER_SPACING)
+
+
+class FrogContext(namedtuple("FrogContext",
+                             ["board", "window", "x_offset", "y_offset"])):
+    """
+    The context shared by the frogs in an Abagio game.
+    
+    Passed to each Frog when it is created, so that the frogs can share
+    a single object holding what is the same for all of them. Subclass
+    of namedtuple.
+    
+    Additional methods: none
+    
+    Additional instance variables:
+        board - the Board the frogs are a part of.
+        window - the Window the frogs should be rendered onto.
+        x_offset - the offset that should be added to the x coordinate
+            of the space a frog is on when determining the x coordinate
+            of the frog, to account for the location of the board in the
+            display window.
+        y_offset - the offset that should be added to the y coordinate
+            of the space a frog is on when determining the y coordinate
+            of the frog, to account for the location of the board in the
+            display window.
+    """
+    
+    __slots__ = ()
@@ -4,6 +4,9 @@ Contains classes related to displaying the Abagio game.
 Classes:
     Window - the game window (with methods to display various items).
     ResourceManager - loads and stores game assets.
+
+Constants:
+    BLACK, WHITE - the Pygame Colors black and white.
 """
 
 from pathlib import Path
@@ -11,6 +14,9 @@ from pathlib import Path
 import pygame
 from pygame import gfxdraw
 
+BLACK = pygame.Color("black")
+WHITE = pygame.Color("white")
+
 
 class Window:
     """
@@ -21,11 +27,18 @@ class Window:
     once.
     
     Note that changes made to the window will not be reflected in the
-    visible Pygame display until the update method is called.
+    visible Pygame display until the update method is called. Only the
+    parts of the window drawn onto (using this class's methods) since
+    the previous call to update, or between the previous two calls, are
+    updated; drawing onto the game_display Surface directly will not
+    necessarily be reflected in the visible display. The
+    invalidate_display method can be used to update the whole display
+    instead, such as when the visible display has been damaged.
     
-    Methods: fill, update, draw_text, draw_multi_line_text,
-        draw_button, draw_rectangle, draw_circle, draw_frog,
-        draw_circle_outline, draw_image
+    Methods: fill, update, invalidate_display, draw_background, draw_text,
+        draw_multi_line_text, render_multi_line_text, draw_button,
+        render_button, draw_rectangle, draw_circle, render_circle,
+        draw_frog, draw_circle_outline, draw_image, draw_images
     
     Instance variables:
         game_display - the pygame display Surface used for the game
@@ -33,6 +46,37 @@ class Window:
         font - the Font used to display text in the window.
     """
     
+    # Non-public instance variables:
+    #    _dirty_rects - the list of Rects bounding the parts of the
+    #        window drawn onto since the update method was last called.
+    #    _previous_dirty_rects - the list of Rects bounding the parts of
+    #        the window drawn onto between the previous two calls to the
+    #        update method. These also need to be updated, since
+    #        whatever was drawn there may since have been drawn over by
+    #        the background.
+    #    _background - the Surface most recently drawn with the
+    #        draw_background method, or None if that method has not
+    #        been called.
+    #    _colors - a dictionary from each color string that has been
+    #        used to draw onto the window to the corresponding Pygame
+    #        Color, so that each string only needs to be parsed once.
+    #    _text_surfaces - a dictionary from (text, color) tuples, with
+    #        the color as an RGBA tuple, to the Surface of that single
+    #        line of text rendered in that color with the font, so that
+    #        each line only needs to be rendered once.
+    #    _frog_sprites - a dictionary from (radius, color) tuples, with
+    #        the color as an RGBA tuple, to the Surface of a frog of that
+    #        radius and color, so that each kind of frog only needs to
+    #        be rendered once.
+    #    _disc_masks - a dictionary from each circle radius that has
+    #        been used to the transparent Surface of a filled,
+    #        antialiased white circle of that radius, which can be
+    #        recolored to render a circle of any color.
+    #    _outlines - a dictionary from (radius, color, thickness)
+    #        tuples, with the color as an RGBA tuple, to the Surface of
+    #        a circle outline with those parameters, so that each kind of
+    #        outline only needs to be rendered once.
+    
     def __init__(self):
         """
         Initialize Pygame and create and display the window.
@@ -46,26 +90,103 @@ class Window:
         pygame.display.set_caption("Abagio")
         
         self.font = pygame.font.SysFont(None, 35)
+        
+        self._dirty_rects = []
+        self._previous_dirty_rects = []
+        self._background = None
+        self._colors = {}
+        self._text_surfaces = {}
+        self._frog_sprites = {}
+        self._disc_masks = {}
+        self._outlines = {}
     
-        self.update()
+        pygame.display.update()
         
     def fill(self, color):
         """
         Fill the window with the specified color.
         
         Arguments:
-            color - a string representing a Pygame color.
+            color - a Pygame Color, or a string representing one.
         """
-        self.game_display.fill(pygame.Color(color))
+        self._dirty_rects.append(
+            self.game_display.fill(self._color(color)))
         
     def update(self):
         """
         Update the Pygame display.
         
         This is necessary for changes previously made to the window to
-        be reflected in the visible Pygame display.
+        be reflected in the visible Pygame display. Only the parts of
+        the window drawn onto since this method was last called, or
+        between the previous two calls to this method, are updated.
         """
-        pygame.display.update()
+        pygame.display.update(self._previous_dirty_rects + self._dirty_rects)
+        self._previous_dirty_rects = self._dirty_rects
+        self._dirty_rects = []
+    
+    def invalidate_display(self):
+        """
+        Make the next call to update update the whole Pygame display.
+        
+        This should be called whenever the contents of the visible
+        display may have been lost (for example, when the window is
+        uncovered or restored after being minimized), since otherwise
+        only the parts of it drawn onto recently would be redrawn.
+        """
+        self._dirty_rects.append(self.game_display.get_rect())
+    
+    def _color(self, color):
+        # Return the Pygame Color represented by the given string,
+        # reusing the Color created the first time it was requested.
+        # A Color is returned as is.
+        #
+        # Arguments:
+        #    color - a Pygame Color, or a string representing one.
+        if isinstance(color, pygame.Color):
+            return color
+        try:
+            return self._colors[color]
+        except KeyError:
+            self._colors[color] = pygame.Color(color)
+            return self._colors[color]
+    
+    def _render_text(self, text, color):
+        # Return a Surface holding the given single line of text
+        # rendered in the given color with the font, reusing the
+        # Surface rendered the first time it was requested.
+        #
+        # Arguments:
+        #    text - a string representing a single line of text.
+        #    color - a Pygame Color, or a string representing one, that
+        #        the text should be rendered in.
+        color = self._color(color)
+        key = (text, tuple(color))
+        try:
+            return self._text_surfaces[key]
+        except KeyError:
+            self._text_surfaces[key] = self.font.render(text, True, color)
+            return self._text_surfaces[key]
+    
+    def draw_background(self, image):
+        """
+        Draw an image covering the whole window as its background.
+        
+        Arguments:
+            image - the Pygame Surface to be drawn with its top-left
+                corner at the top-left corner of the window. Should be
+                the same size as the window.
+        
+        The whole window is only updated by the next call to the update
+        method if the image is not the same Surface drawn by the
+        previous call to this method; otherwise, only the parts of the
+        window drawn onto over the background are. As a result, the
+        image should not be modified after being passed to this method.
+        """
+        self.game_display.blit(image, (0, 0))
+        if image is not self._background:
+            self._background = image
+            self._dirty_rects.append(self.game_display.get_rect())
         
     def draw_text(self, x, y, text, color, center_on_coordinates=False):
         """
@@ -78,8 +199,8 @@ class Window:
                 center_on_coordinates below).
             text - a string representing a single line of text (should
                 not include newline characters).
-            color - a string representing the Pygame color the text
-                should be displayed in.
+            color - a Pygame Color, or a string representing one, that
+                the text should be displayed in.
             center_on_coordinates - if True, the x and y coordinates
                 provided represent where the center of the text Surface
                 should be displayed in the window. If False, the x and
@@ -87,15 +208,16 @@ class Window:
                 corner of the text Surface should be displayed in the
                 window. Default False.
         
-        The font instance variable is used to render the text.
+        The font instance variable is used to render the text. Each
+        distinct line of text is only rendered the first time it is
+        drawn in a given color.
         """
-        screen_text = self.font.render(text, True, pygame.Color(color))
+        screen_text = self._render_text(text, color)
         if center_on_coordinates:
-            self.game_display.blit(
-                screen_text, (x - screen_text.get_rect().width / 2,
-                              y - screen_text.get_rect().height / 2))
+            width, height = screen_text.get_size()
+            self.draw_image(x - width / 2, y - height / 2, screen_text)
         else:
-            self.game_display.blit(screen_text, (x, y))
+            self.draw_image(x, y, screen_text)
     
     def draw_multi_line_text(self, x, y, text, color):
         """
@@ -108,14 +230,39 @@ class Window:
                 Surface should be displayed in the window.
             text - a string representing one or more lines of text,
                 with lines separated by newline characters (\\n).
-            color - a string representing the Pygame color the text
-                should be displayed in.
+            color - a Pygame Color, or a string representing one, that
+                the text should be displayed in.
         
         The font instance variable is used to render the text.
         """
-        for index, line in enumerate(text.split("\n")):
-            self.draw_text(x, y + index * self.font.get_linesize(), line,
-                           color, False)
+        self.draw_image(x, y, self.render_multi_line_text(text, color))
+    
+    def render_multi_line_text(self, text, color):
+        """
+        Render one or more lines of text onto a new Surface.
+        
+        Arguments:
+            text - a string representing one or more lines of text,
+                with lines separated by newline characters (\\n).
+            color - a Pygame Color, or a string representing one, that
+                the text should be rendered in.
+        
+        The font instance variable is used to render the text. Return a
+        transparent Surface just large enough to hold the text, with
+        the lines drawn from top to bottom, so that it can be drawn
+        onto the window (possibly many times) with the draw_image
+        method. The Surface is converted to the display's pixel format
+        so that drawing it does not require a conversion each time.
+        """
+        lines = text.split("\n")
+        line_size = self.font.get_linesize()
+        width = max(self.font.size(line)[0] for line in lines)
+        surface = pygame.Surface((width, len(lines) * line_size),
+                                 pygame.SRCALPHA)
+        for index, line in enumerate(lines):
+            surface.blit(self._render_text(line, color),
+                         (0, index * line_size))
+        return surface.convert_alpha()
     
     def draw_button(self, x, y, width, height, text, button_color, text_color):
         """
@@ -130,18 +277,42 @@ class Window:
             height - the desired height of the button (in pixels).
             text - a string with no newline characters representing the
                 single line of text to be centered inside the button.
-            button_color - a string representing the Pygame color the
-                button Rect should be displayed in.
-            text_color - a string representing the Pygame color the
-                button text should be displayed in.
+            button_color - a Pygame Color, or a string representing
+                one, that the button Rect should be displayed in.
+            text_color - a Pygame Color, or a string representing one,
+                that the button text should be displayed in.
 
         The font instance variable is used to render the button text.
         """
-        button = pygame.draw.rect(self.game_display,
-                                  pygame.Color(button_color),
-                                  (x, y, width, height))
-        self.draw_text(x + width / 2, y + height / 2, text, text_color, True)
-        return button
+        return self.draw_image(x, y, self.render_button(
+            width, height, text, button_color, text_color))
+    
+    def render_button(self, width, height, text, button_color, text_color):
+        """
+        Render a button onto a new Surface.
+        
+        Arguments:
+            width - the desired width of the button (in pixels).
+            height - the desired height of the button (in pixels).
+            text - a string with no newline characters representing the
+                single line of text to be centered inside the button.
+            button_color - a Pygame Color, or a string representing
+                one, that the button should be rendered in.
+            text_color - a Pygame Color, or a string representing one,
+                that the button text should be rendered in.
+        
+        The font instance variable is used to render the button text.
+        Return a Surface of the given size holding the button, in the
+        display's pixel format, so that it can be drawn onto the window
+        (possibly many times) with the draw_image method.
+        """
+        button = pygame.Surface((width, height))
+        button.fill(self._color(button_color))
+        button_text = self.font.render(text, True, self._color(text_color))
+        button.blit(button_text,
+                    (width / 2 - button_text.get_rect().width / 2,
+                     height / 2 - button_text.get_rect().height / 2))
+        return button.convert()
     
     def draw_rectangle(self, x, y, width, height, color):
         """
@@ -154,11 +325,11 @@ class Window:
                 rectangle in the window.
             width - the desired width of the rectangle (in pixels).
             height - the desired height of the rectangle (in pixels).
-            color - a string representing the Pygame color the rectangle
-                should be displayed in.
+            color - a Pygame Color, or a string representing one, that
+                the rectangle should be displayed in.
         """
-        pygame.draw.rect(
-            self.game_display, pygame.Color(color), (x, y, width, height))
+        self._dirty_rects.append(pygame.draw.rect(
+            self.game_display, self._color(color), (x, y, width, height)))
     
     def draw_circle(self, x, y, radius, color):
         """
@@ -170,12 +341,50 @@ class Window:
             y - the desired y coordinate of the center of the circle in
                 the window.
             radius - the desired radius of the circle (in pixels).
-            color - a string representing the Pygame color the circle
-                should be displayed in.
+            color - a Pygame Color, or a string representing one, that
+                the circle should be displayed in.
         """
-        gfxdraw.aacircle(self.game_display, x, y, radius, pygame.Color(color))
-        gfxdraw.filled_circle(self.game_display, x, y, radius,
-                              pygame.Color(color))
+        self.draw_image(x - radius, y - radius,
+                        self.render_circle(radius, color))
+    
+    def render_circle(self, radius, color):
+        """
+        Render a filled, antialiased circle onto a new Surface.
+        
+        Arguments:
+            radius - the desired radius of the circle (in pixels).
+            color - a Pygame Color, or a string representing one, that
+                the circle should be rendered in.
+        
+        Return a transparent Surface just large enough to hold the
+        circle, with the circle centered on it, so that it can be drawn
+        onto the window (possibly many times) with the draw_image
+        method. To center the circle on a given point, the Surface
+        should be drawn radius pixels above and to the left of it.
+        """
+        surface = self._disc_mask(radius).copy()
+        surface.fill(self._color(color), special_flags=pygame.BLEND_RGBA_MULT)
+        return surface
+    
+    def _disc_mask(self, radius):
+        # Return a transparent Surface just large enough to hold a
+        # filled, antialiased white circle of the given radius, with the
+        # circle centered on it, reusing the Surface rendered the first
+        # time it was requested. The Surface must not be modified;
+        # multiplying a copy of it by a color gives a circle of that
+        # color.
+        #
+        # Arguments:
+        #    radius - the radius of the circle (in pixels).
+        try:
+            return self._disc_masks[radius]
+        except KeyError:
+            surface = pygame.Surface((2 * radius + 1, 2 * radius + 1),
+                                     pygame.SRCALPHA)
+            gfxdraw.aacircle(surface, radius, radius, radius, WHITE)
+            gfxdraw.filled_circle(surface, radius, radius, radius, WHITE)
+            self._disc_masks[radius] = surface.convert_alpha()
+            return self._disc_masks[radius]
     
     def draw_frog(self, x, y, radius, color):
         """
@@ -188,20 +397,50 @@ class Window:
                 representing the frog in the window.
             radius - the desired radius of the circle representing the
                 frog (in pixels).
-            color - a string representing the Pygame color the circle
-                representing the frog should be displayed in.
+            color - a Pygame Color, or a string representing one, that
+                the circle representing the frog should be displayed in.
         
         The frog will be displayed as a filled, antialiased circle with
-        the desired parameters, with a black circular border.
+        the desired parameters, with a black circular border. Each kind
+        of frog (radius and color) is only rendered the first time it
+        is drawn; after that, the same image is reused.
         
         Return the circumscribed Rect around the circle drawn (the
         bounding box of the frog).
         """
-        gfxdraw.aacircle(self.game_display, x, y, radius, pygame.Color(color))
-        bounding_rect = pygame.draw.circle(
-            self.game_display, pygame.Color(color), (x, y), radius)
-        self.draw_circle_outline(x, y, radius, "black", 5)
-        return bounding_rect
+        color = self._color(color)
+        key = (radius, tuple(color))
+        try:
+            sprite = self._frog_sprites[key]
+        except KeyError:
+            sprite = self._render_frog(radius, color)
+            self._frog_sprites[key] = sprite
+        self.draw_image(x - radius, y - radius, sprite)
+        return pygame.Rect(x - radius, y - radius, 2 * radius, 2 * radius)
+    
+    def _render_frog(self, radius, color):
+        # Render an Abagio frog onto a new transparent Surface just
+        # large enough to hold it, with the frog centered on it, and
+        # return the Surface.
+        #
+        # Arguments:
+        #    radius - the radius of the circle representing the frog
+        #        (in pixels).
+        #    color - the Pygame Color the circle representing the frog
+        #        should be rendered in.
+        size = (2 * radius + 1, 2 * radius + 1)
+        # Antialiased pixels drawn onto a transparent Surface overwrite
+        # the alpha of what is already there rather than blending with
+        # it, so draw the frog onto an opaque Surface exactly as it
+        # would be drawn onto the window...
+        frog = pygame.Surface(size)
+        gfxdraw.aacircle(frog, radius, radius, radius, color)
+        pygame.draw.circle(frog, color, (radius, radius), radius)
+        self._draw_circle_outline_onto(frog, radius, radius, radius, BLACK, 5)
+        # ...and then cut it out with an antialiased circular mask.
+        surface = self._disc_mask(radius).copy()
+        surface.blit(frog, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+        return surface
     
     def draw_circle_outline(self, x, y, radius, color, thickness=1):
         """
@@ -215,20 +454,67 @@ class Window:
             radius - the desired radius of the circle whose outline
                 is being drawn (in pixels). Represents the distance from
                 the center to the outermost part of the outline.
-            color - a string representing the Pygame color the circle
-                outline should be displayed in.
+            color - a Pygame Color, or a string representing one, that
+                the circle outline should be displayed in.
             thickness - the desired thickness of the circle outline, in
                 pixels (default 1). Should be an integer >= 1; if > 1,
                 the thickness of the outline extends toward the center
                 of the circle whose outline is being drawn. Must not be
-                greater than radius. Large values may potentially cause
-                performance issues.
+                greater than radius.
+        
+        Each kind of outline (radius, color, and thickness) is only
+        rendered the first time it is drawn; after that, the same image
+        is reused.
         """
+        color = self._color(color)
+        key = (radius, tuple(color), thickness)
+        try:
+            outline = self._outlines[key]
+        except KeyError:
+            outline = self._render_circle_outline(radius, color, thickness)
+            self._outlines[key] = outline
+        self.draw_image(x - radius, y - radius, outline)
+    
+    def _render_circle_outline(self, radius, color, thickness):
+        # Render an antialiased outline of a circle onto a new
+        # transparent Surface just large enough to hold it, with the
+        # outline centered on it, and return the Surface.
+        #
+        # Arguments:
+        #    radius, thickness - as for draw_circle_outline.
+        #    color - the Pygame Color the outline should be rendered in.
+        
+        # Cut the inner disc (if any) out of the outer one, leaving the
+        # antialiased edges of both, then whiten what is left and
+        # multiply it by the color.
+        surface = self._disc_mask(radius).copy()
+        if thickness < radius:
+            surface.blit(self._disc_mask(radius - thickness),
+                         (thickness, thickness),
+                         special_flags=pygame.BLEND_RGBA_SUB)
+            surface.fill((255, 255, 255, 0),
+                         special_flags=pygame.BLEND_RGBA_MAX)
+        surface.fill(color, special_flags=pygame.BLEND_RGBA_MULT)
+        return surface
+    
+    def _draw_circle_outline_onto(self, surface, x, y, radius, color,
+                                  thickness):
+        # Draw an antialiased outline of a circle onto the given Surface
+        # (see the draw_circle_outline method for details).
+        #
+        # Arguments:
+        #    surface - the Surface to draw the outline onto.
+        #    x - the x coordinate of the center of the circle on the
+        #        Surface.
+        #    y - the y coordinate of the center of the circle on the
+        #        Surface.
+        #    radius, color, thickness - as for draw_circle_outline.
+        color = self._color(color)
+        aacircle = gfxdraw.aacircle
+        circle = gfxdraw.circle
         for _ in range(thickness):
-            gfxdraw.aacircle(self.game_display, x, y, radius,
-                             pygame.Color(color))
-            gfxdraw.circle(self.game_display, x, y, radius,
-                           pygame.Color(color))
+            aacircle(surface, x, y, radius, color)
+            circle(surface, x, y, radius, color)
             radius -= 1
     
     def draw_image(self, x, y, image):
@@ -243,7 +529,27 @@ class Window:
             image - the Pygame Surface representing the image to be
                 drawn onto the window.
         """
-        return self.game_display.blit(image, (x, y))
+        rect = self.game_display.blit(image, (x, y))
+        self._dirty_rects.append(rect)
+        return rect
+    
+    def draw_images(self, images):
+        """
+        Draw several images onto the window and return their Rects.
+        
+        Arguments:
+            images - a sequence of (image, (x, y)) pairs, where each
+                image is the Pygame Surface representing an image to be
+                drawn onto the window and x and y are the desired
+                coordinates of its top-left corner in the window.
+        
+        The images are drawn in the given order with a single call into
+        Pygame. A list of their bounding Rects, in the same order, is
+        returned.
+        """
+        rects = self.game_display.blits(images)
+        self._dirty_rects.extend(rects)
+        return rects
 
 
 class ResourceManager:
@@ -256,6 +562,10 @@ class ResourceManager:
             "die 3", "die 4", "die 5", and "die 6".
     """
     
+    # Non-public instance variables:
+    #    _res_dir - the Path of the project's "res" directory, which
+    #        holds the image files.
+    
     def __init__(self):
         """Load the game images into the images dictionary.
 
@@ -264,6 +574,9 @@ class ResourceManager:
         """
         self.images = {}
         try:
+            # The "res" directory is at the top level of the project,
+            # two levels above the package directory this file is in.
+            self._res_dir = Path(__file__).resolve().parents[2] / "res"
             self.images["board"] = self._load_image("board.jpg")
             self.images["die 1"] = self._load_image("die1.png")
             self.images["die 2"] = self._load_image("die2.png")
@@ -285,13 +598,16 @@ class ResourceManager:
     def _load_image(self, file_name):
         # Load and return the Pygame Surface representing the image in
         # the "res" directory of the project with the given file name.
+        # The Surface is converted to the display's pixel format, keeping
+        # per-pixel alpha only if the image file has an alpha channel.
         #
-        # Raises a NameError if the __file__ attribute is not set.
         # Raises a FileNotFoundError if the specified file cannot be
         # found.
         #
         # Arguments:
         #    file_name - the file name (with extension) of the image
         #        file from the "res" directory to be loaded.
-        return pygame.image.load(
-            Path(__file__) / f"../../../res/{file_name}").convert()
+        image = pygame.image.load(self._res_dir / file_name)
+        if image.get_flags() & pygame.SRCALPHA:
+            return image.convert_alpha()
+        return image.convert()
@@ -1,11 +1,17 @@
 """
-Contains a utility timer class.
+Contains utility timer classes.
 
-Class:
+Classes:
     Timer - a reusable, internal timer.
+    TimerScheduler - finds which of many timers are done.
+
+Functions:
+    expired - filter a collection of timers down to those that are done.
 """
 
-import pygame
+import heapq
+
+from pygame.time import get_ticks as _get_ticks
 
 
 class Timer:
@@ -24,14 +30,27 @@ class Timer:
     and the is_done method corresponds to whether or not the timer is
     currently ringing/beeping.
     
-    Methods: start, is_done, stop
+    Methods: start, is_done, remaining, stop, tick_now (static)
 
     Instance variables:
         done_time - the timestamp, as obtained from pygame.time's
             get_ticks() method, at which the timer will be considered
-            done. -1 if the timer has not been started or is stopped.
+            done. STOPPED if the timer has not been started or is
+            stopped. The timer is done exactly when the current time is
+            the same as or after done_time, so code that polls many
+            timers against a single time may compare their done_time
+            fields directly rather than calling is_done.
+    
+    Class constants:
+        STOPPED - the done_time of a timer that has not been started
+            or is stopped: a timestamp far later than any Pygame time
+            a game could reach, so that such a timer is never done.
     """
     
+    STOPPED = 1 << 62
+    
+    __slots__ = ("done_time",)
+    
     def __init__(self, time_to_wait=None, start_time=None):
         """
         Create and, if desired, start the timer.
@@ -49,13 +68,26 @@ class Timer:
                 or None.
         """
         if start_time is None:
-            start_time = pygame.time.get_ticks()
+            start_time = _get_ticks()
         if time_to_wait is None:
-            self.done_time = -1
+            self.done_time = Timer.STOPPED
         else:
             self.start(time_to_wait, start_time)
     
-    def start(self, time_to_wait, start_time=None):
+    @staticmethod
+    def tick_now():
+        """
+        Return the current Pygame time, for passing to timers.
+        
+        Every method that needs the current time also accepts it as an
+        argument. Code starting or polling several timers in the same
+        frame can call this once and pass the result to each of them,
+        so that they all agree on the time and the clock is only read
+        once.
+        """
+        return _get_ticks()
+    
+    def start(self, time_to_wait, start_time=None, /):
         """
         Start the timer.
         
@@ -68,13 +100,14 @@ class Timer:
                 is used.
         
         The timer does not need to be stopped in order to be started
-        again.
+        again. Times are whole numbers of Pygame ticks; fractional
+        values are truncated, so that done_time is always an integer.
         """
         if start_time is None:
-            start_time = pygame.time.get_ticks()
-        self.done_time = start_time + time_to_wait
+            start_time = _get_ticks()
+        self.done_time = int(start_time) + int(time_to_wait)
     
-    def is_done(self, current_time=None):
+    def is_done(self, current_time=None, /):
         """
         Return whether or not the timer is done (and not stopped).
 
@@ -92,8 +125,37 @@ class Timer:
         as described previously) is the same as or after the done time.
         """
         if current_time is None:
-            current_time = pygame.time.get_ticks()
-        return self.done_time != -1 and current_time >= self.done_time
+            # A stopped timer can never be done, so there is no need to
+            # find out the time for it.
+            if self.done_time == Timer.STOPPED:
+                return False
+            current_time = _get_ticks()
+        # Otherwise, a stopped timer's done time can never be reached,
+        # so it needs no separate check.
+        return current_time >= self.done_time
+    
+    def remaining(self, current_time=None, /):
+        """
+        Return the number of Pygame ticks until the timer is done.
+        
+        Arguments:
+            current_time - the timestamp, as obtained from pygame.time's
+                get_ticks() method, to be used as the current time. If
+                not provided or None, the current Pygame time is used.
+        
+        If the timer is stopped or was never started, return STOPPED,
+        which is longer than any timer that will be done could have
+        left. Otherwise, return how long after the current time the done
+        time is, or 0 if the timer is already done. Code coordinating
+        several timers can use this (for example, taking the min over
+        all of them) to find when the next one will be done rather
+        than polling all of them with is_done every frame.
+        """
+        if self.done_time == Timer.STOPPED:
+            return Timer.STOPPED
+        if current_time is None:
+            current_time = _get_ticks()
+        return max(0, self.done_time - current_time)
     
     def stop(self):
         """
@@ -102,4 +164,91 @@ class Timer:
         The timer will not be considered done until it is started and
         the necessary time has elapsed again.
         """
-        self.done_time = -1
+        self.done_time = Timer.STOPPED
+
+
+class TimerScheduler:
+    """
+    Keeps track of started timers in the order they will be done in.
+    
+    Polling a scheduler only looks at the timers that are done, rather
+    than calling is_done on every timer every frame. A timer is
+    tracked from when it is added until it is found to be done; a timer
+    that is stopped or restarted while tracked is quietly dropped, and
+    must be added again after being restarted to be tracked again.
+    
+    Methods: add, poll_fired
+    """
+    
+    # Non-public instance variables:
+    #    _heap - a heap of (done time, sequence number, Timer) tuples,
+    #        one for each time a timer was added. The sequence number
+    #        breaks ties between equal done times, since Timers cannot
+    #        be compared. Entries whose done time no longer matches
+    #        their timer's are stale and are discarded when they reach
+    #        the top of the heap.
+    #    _sequence_number - the sequence number to give the next entry.
+    
+    __slots__ = ("_heap", "_sequence_number")
+    
+    def __init__(self):
+        """Create the scheduler, initially tracking no timers."""
+        self._heap = []
+        self._sequence_number = 0
+    
+    def add(self, timer):
+        """
+        Start tracking a timer.
+        
+        Arguments:
+            timer - the started Timer to track. If it is stopped, it is
+                not tracked.
+        """
+        if timer.done_time != Timer.STOPPED:
+            heapq.heappush(self._heap,
+                           (timer.done_time, self._sequence_number, timer))
+            self._sequence_number += 1
+    
+    def poll_fired(self, current_time=None, /):
+        """
+        Return a list of the tracked timers that are done, and stop them.
+        
+        Arguments:
+            current_time - the timestamp, as obtained from pygame.time's
+                get_ticks() method, to be used as the current time. If
+                not provided or None, the current Pygame time is used.
+        
+        The returned timers are in the order they became done in, and
+        are stopped and no longer tracked. Timers that were stopped or
+        restarted since being added are never returned.
+        """
+        if current_time is None:
+            current_time = _get_ticks()
+        heap = self._heap
+        fired = []
+        while heap and heap[0][0] <= current_time:
+            done_time, _, timer = heapq.heappop(heap)
+            if timer.done_time == done_time:
+                timer.stop()
+                fired.append(timer)
+        return fired
+
+
+def expired(timers, current_time=None, /):
+    """
+    Return a list of the timers in a collection that are done.
+    
+    Arguments:
+        timers - an iterable of Timers.
+        current_time - the timestamp, as obtained from pygame.time's
+            get_ticks() method, to be used as the current time for all
+            of the timers. If not provided or None, the current Pygame
+            time is used.
+    
+    The timers are returned in the order they were given in, and are
+    not stopped. The current time is only determined once, however
+    many timers there are.
+    """
+    if current_time is None:
+        current_time = _get_ticks()
+    return [timer for timer in timers if timer.done_time <= current_time]